@@ -1,393 +1,655 @@
-import sys
-import time
-import warnings
-warnings.filterwarnings('ignore')
-
-from gs_config import print_header, SKILLS_DATABASE
-
-# ============================================================================
-#   VALIDAÇÃO INLINE
-# ============================================================================
-def validate_database_inline():
-    """Valida a base de dados inline."""
-    all_skills = set(SKILLS_DATABASE.keys())
-    print("\n🔍 Validando base de dados...")
-    for skill_id, data in SKILLS_DATABASE.items():
-        for prereq in data['Pre_Reqs']:
-            if prereq not in all_skills:
-                raise ValueError(f"Pré-requisito inválido: {skill_id} → {prereq}")
-        if data['Valor'] <= 0 or data['Tempo'] <= 0 or data['Complexidade'] <= 0:
-            raise ValueError(f"Valores inválidos em {skill_id}")
-    print("✅ Base de dados validada com sucesso!")
-    return True
-
-# ============================================================================
-# IMPORTAÇÕES DOS DESAFIOS
-# ============================================================================
-try:
-    from gs_challenge1 import ImprovedMaxValuePathDP
-    from gs_challenge2 import ImprovedCriticalSkillsAnalyzer
-    from gs_challenge3 import ImprovedAdaptabilityOptimizer
-    from gs_challenge4 import ImprovedSortingAlgorithms, SprintDivider, benchmark_sorting
-    from gs_challenge5 import ImprovedSkillRecommender
-    from gs_config import (TARGET_SKILL, MAX_TIME, MAX_COMPLEXITY, N_MONTE_CARLO,
-                           CRITICAL_SKILLS, BASIC_SKILLS, MIN_ADAPTABILITY,
-                           GLOBAL_SEED)
-    import random
-    import numpy as np
-    CHALLENGES_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ Erro ao importar desafios: {e}")
-    CHALLENGES_AVAILABLE = False
-
-# ============================================================================
-# IMPORTAÇÃO DE VISUALIZAÇÃO MELHORADA
-# ============================================================================
-try:
-    from gs_visualization import ImprovedVisualization as ProfessionalVisualization
-    IMPROVED_PLOTS = True
-    print("✅ Módulo de visualização carregado")
-except ImportError:
-    IMPROVED_PLOTS = False
-    print("⚠️ Visualizações desabilitadas")
-
-
-# ============================================================================
-# IMPORTAÇÃO DE TESTES
-# ============================================================================
-try:
-    from gs_tests import run_tests_suite, validate_input_file
-    TESTS_AVAILABLE = True
-    print("✅ Módulo de testes carregado")
-except ImportError:
-    TESTS_AVAILABLE = False
-    print("⚠️ Testes desabilitados")
-
-# ============================================================================
-# EXECUÇÃO DOS DESAFIOS COM VISUALIZAÇÃO
-# ============================================================================
-def run_challenge1_with_viz():
-    """Executa Desafio 1 com visualização completa"""
-    print_header("DESAFIO 1: CAMINHO DE VALOR MÁXIMO")
-    solver = ImprovedMaxValuePathDP(SKILLS_DATABASE, TARGET_SKILL)
-    is_feasible, msg = solver.check_feasibility(MAX_TIME, MAX_COMPLEXITY)
-    print(f"\n📊 Viabilidade: {msg}")
-    if not is_feasible:
-        time_limit = solver.min_feasible_time + 50
-        complexity_limit = solver.min_feasible_complexity + 6
-        print(f"\n⚙️ Usando limites ajustados: T≤{time_limit}, C≤{complexity_limit}")
-    else:
-        time_limit = MAX_TIME
-        complexity_limit = MAX_COMPLEXITY
-    print(f"\n🎲 Executando {N_MONTE_CARLO} simulações Monte Carlo...")
-    start = time.time()
-    mc_result = solver.solve_with_uncertainty(time_limit, complexity_limit, N_MONTE_CARLO)
-    elapsed = time.time() - start
-    if mc_result['success']:
-        print(f"\n✅ SOLUÇÃO ENCONTRADA (tempo: {elapsed:.2f}s):")
-        print(f"  Caminho: {' → '.join(mc_result['path'])}")
-        print(f"\n📊 RESULTADOS:")
-        print(f"  Valor Determinístico: {mc_result['deterministic_value']}")
-        print(f"  E[Valor]: {mc_result['expected_value']:.2f}")
-        print(f"  σ(Valor): {mc_result['std_value']:.2f}")
-        print(f"  Range: [{mc_result['min_value']:.2f}, {mc_result['max_value']:.2f}]")
-        print(f"  CV: {(mc_result['std_value']/mc_result['expected_value'])*100:.2f}%")
-        print(f"\n  Tempo Total: {mc_result['total_time']}h")
-        print(f"  Complexidade Total: {mc_result['total_complexity']}")
-        if IMPROVED_PLOTS:
-            print("\n📈 Gerando visualização...")
-            ProfessionalVisualization.plot_monte_carlo_enhanced(
-                simulations=mc_result['simulations'],
-                deterministic_value=mc_result['deterministic_value'],
-                filename='desafio1_monte_carlo.png',
-                show=True
-            )
-        return mc_result
-    else:
-        print(f"\n❌ Solução não encontrada")
-        return None
-
-def run_challenge2_with_viz():
-    """Executa Desafio 2 com visualização"""
-    print_header("DESAFIO 2: VERIFICAÇÃO CRÍTICA")
-    analyzer = ImprovedCriticalSkillsAnalyzer(SKILLS_DATABASE, CRITICAL_SKILLS)
-    print("\n🔗 Analisando dependências...")
-    analyzer.analyze_dependency_impact()
-    print(f"\n🔄 Analisando 120 permutações de {CRITICAL_SKILLS}...")
-    analysis = analyzer.analyze_all_permutations()
-    stats = analysis['statistics']
-    print(f"\n📊 ESTATÍSTICAS:")
-    print(f"  Média: {stats['mean']:.2f}h")
-    print(f"  Desvio Padrão: {stats['std']:.2f}h")
-    print(f"  Mínimo: {stats['min']:.2f}h")
-    print(f"  Máximo: {stats['max']:.2f}h")
-    print(f"  Range: {stats['range']:.2f}h")
-    print(f"\n🏆 TOP 3 ORDENS:")
-    for i, result in enumerate(analysis['top3'], 1):
-        print(f"\n  #{i}: {' → '.join(result['order'])}")
-        print(f"      Tempo Total: {result['total_time']}h")
-        waiting = sum(e['time'] for e in result['timeline'] if e['action'] == 'waiting')
-        acquire = sum(e['time'] for e in result['timeline'] if e['action'] == 'acquire')
-        print(f"      Breakdown: {waiting}h (espera) + {acquire}h (críticas)")
-    heuristics = analyzer.identify_heuristics(analysis['top3'])
-    if heuristics:
-        print(f"\n💡 HEURÍSTICAS IDENTIFICADAS:")
-        for h in heuristics:
-            print(f"  • {h}")
-    if IMPROVED_PLOTS:
-        print("\n📈 Gerando visualização...")
-        ProfessionalVisualization.plot_top3_timeline_enhanced(
-            top3=analysis['top3'],
-            filename='desafio2_top3.png',
-            show=True
-        )
-    return analysis
-
-def run_challenge3_with_viz():
-    """Executa Desafio 3 com visualização"""
-    print_header("DESAFIO 3: PIVÔ MAIS RÁPIDO")
-    optimizer = ImprovedAdaptabilityOptimizer(SKILLS_DATABASE, BASIC_SKILLS, MIN_ADAPTABILITY)
-    print("\n🔬 COMPARAÇÃO DE SOLUÇÕES:")
-    start = time.time()
-    greedy = optimizer.greedy_solution(verbose=False)
-    greedy_time = time.time() - start
-    start = time.time()
-    dp = optimizer.optimal_solution_dp(verbose=False)
-    dp_time = time.time() - start
-    print(f"\n  GULOSO (V/T):")
-    print(f"    Skills: {greedy['selected']}")
-    print(f"    Tempo: {greedy['total_time']}h")
-    print(f"    Valor: {greedy['total_value']}")
-    print(f"    Execução: {greedy_time*1000:.3f}ms")
-    if dp:
-        print(f"\n  ÓTIMO (DP):")
-        print(f"    Skills: {dp['selected']}")
-        print(f"    Tempo: {dp['total_time']}h")
-        print(f"    Valor: {dp['total_value']}")
-        print(f"    Execução: {dp_time*1000:.3f}ms")
-        if greedy['total_time'] == dp['total_time']:
-            print(f"\n  ✅ Guloso encontrou solução ÓTIMA!")
-        else:
-            diff = greedy['total_time'] - dp['total_time']
-            pct = (diff / dp['total_time']) * 100
-            print(f"\n  ⚠️ Guloso subótimo: +{diff}h (+{pct:.1f}%)")
-    print("\n" + "="*80)
-    print("CONTRAEXEMPLO: GULOSO NEM SEMPRE É ÓTIMO")
-    print("="*80)
-    counter = optimizer.demonstrate_counterexample()
-    print(f"\n{counter['explanation']}")
-    print(f"\n  Guloso escolhe: {counter['greedy_solution']['choice']} → {counter['greedy_solution']['time']}h")
-    print(f"  Ótimo é: {counter['optimal_solution']['choice']} → {counter['optimal_solution']['time']}h")
-    print("\n📊 Análise empírica de complexidade...")
-    empirical = optimizer.empirical_complexity_analysis(max_size=12)
-    if IMPROVED_PLOTS:
-        print("\n📈 Gerando visualização...")
-        ProfessionalVisualization.plot_complexity_enhanced(
-            empirical_data=empirical,
-            filename='desafio3_complexity.png',
-            show=True
-        )
-    return {'greedy': greedy, 'dp': dp, 'empirical': empirical}
-
-def run_challenge4_with_viz():
-    """Executa Desafio 4 com visualização"""
-    print_header("DESAFIO 4: TRILHAS PARALELAS")
-    divider = SprintDivider(SKILLS_DATABASE)
-    data = divider.prepare_data()
-    print(f"\n📊 Total de habilidades: {len(data)}")
-    print("\n🔄 Ordenando com Merge Sort...")
-    sorted_data = ImprovedSortingAlgorithms.merge_sort(data)
-    print("\n✅ Habilidades ordenadas por Complexidade:")
-    for i, (skill_id, complexity) in enumerate(sorted_data, 1):
-        skill = SKILLS_DATABASE[skill_id]
-        print(f"  {i:2d}. {skill_id} ({skill['Nome']:30s}) - C={complexity}")
-    sprints = divider.divide_sprints(sorted_data)
-    print("\n📦 DIVISÃO EM SPRINTS:")
-    print(f"\n  Sprint A (Skills 1-6):")
-    for skill_id in sprints['sprint_a']['skills']:
-        print(f"    • {skill_id}: {SKILLS_DATABASE[skill_id]['Nome']}")
-    print(f"\n  Sprint B (Skills 7-12):")
-    for skill_id in sprints['sprint_b']['skills']:
-        print(f"    • {skill_id}: {SKILLS_DATABASE[skill_id]['Nome']}")
-    divider.analyze_sprint_balance(sprints)
-    print("\n⏱️ Executando benchmark (100 rodadas)...")
-    bench_results = benchmark_sorting(100)
-    print("\n📊 RESULTADOS DO BENCHMARK:")
-    for algo, metrics in bench_results.items():
-        print(f"  {algo:20s}: {metrics['mean']:.4f}ms "
-              f"(min={metrics['min']:.4f}, max={metrics['max']:.4f})")
-    divider.print_algorithm_justification()
-    if IMPROVED_PLOTS:
-        print("\n📈 Gerando visualização...")
-        try:
-            ProfessionalVisualization.plot_sorting_comparison(
-                benchmark_results=bench_results,
-                filename='desafio4_sorting.png',
-                show=True
-            )
-        except AttributeError:
-            print("⚠️ Método plot_sorting_comparison não disponível na classe de visualização")
-    return {'sprints': sprints, 'benchmark': bench_results}
-
-def run_challenge5_with_viz():
-    """Executa Desafio 5 com visualização"""
-    print_header("DESAFIO 5: RECOMENDAÇÃO DE HABILIDADES")
-    recommender = ImprovedSkillRecommender(SKILLS_DATABASE)
-    recommender.print_market_scenarios()
-    current_profile = {'H1', 'H2', 'H3'}
-    print(f"\n👤 PERFIL ATUAL: {sorted(current_profile)}")
-    print("\n🔬 Comparando abordagens: Guloso vs DP Verdadeiro...")
-    greedy_result = recommender.recommend_greedy(current_profile, 3)
-    dp_result = recommender.recommend_with_dp(current_profile, max_time=5000)
-    print("\n📊 RESULTADOS:")
-    print("\n  GULOSO (E[V]/T):")
-    for i, rec in enumerate(greedy_result['recommendations'], 1):
-        print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
-        print(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h, Score={rec['score']:.4f}")
-    print("\n  DP VERDADEIRO:")
-    if dp_result.get('recommendations'):
-        for i, rec in enumerate(dp_result['recommendations'], 1):
-            print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
-            print(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h")
-        if 'optimal_path' in dp_result:
-            print(f"\n  Path Ótimo: {' → '.join(dp_result['optimal_path'][:5])}...")
-            print(f"  Valor Total: {dp_result.get('optimal_value', 0):.2f}")
-            print(f"  Tempo Total: {dp_result.get('optimal_time', 0)}h")
-    else:
-        print("    Nenhuma recomendação")
-    greedy_ids = set(r['skill_id'] for r in greedy_result['recommendations'])
-    dp_ids = set(r['skill_id'] for r in dp_result.get('recommendations', []))
-    print("\n💡 ANÁLISE:")
-    if greedy_ids == dp_ids:
-        print("  ✅ Guloso coincide com DP (neste caso)")
-    else:
-        overlap = greedy_ids & dp_ids
-        print(f"  ⚠️ Abordagens diferem")
-        print(f"    Sobreposição: {overlap}")
-        print(f"    Apenas Guloso: {greedy_ids - dp_ids}")
-        print(f"    Apenas DP: {dp_ids - greedy_ids}")
-    if IMPROVED_PLOTS:
-        print("\n📈 Gerando visualização...")
-        try:
-            ProfessionalVisualization.plot_recommendation_analysis(
-                greedy_result=greedy_result,
-                dp_result=dp_result,
-                filename='desafio5_recommendation.png',
-                show=True
-            )
-        except AttributeError:
-            print("⚠️ Método plot_recommendation_analysis não disponível na classe de visualização")
-    return {'greedy': greedy_result, 'dp': dp_result}
-
-# ============================================================================
-# FUNÇÃO PARA EXECUTAR TESTES
-# ============================================================================
-def run_tests():
-    """Executa a suite de testes"""
-    if not TESTS_AVAILABLE:
-        print("\n⚠️ Módulo de testes não disponível")
-        return None
-    print("\n📋 Validando gs_input_file...")
-    if hasattr(validate_input_file, '__call__'):
-        try:
-            if not validate_input_file():
-                print("❌ Validação falhou")
-                return None
-        except Exception as e:
-            print(f"❌ Erro na validação: {e}")
-            return None
-    print("\n🧪 Executando suite de testes...")
-    try:
-        result = run_tests_suite(verbosity=2)
-    except Exception as e:
-        print(f"❌ Erro na suíte de testes: {e}")
-        return None
-    print("\n📊 RESUMO DOS TESTES:")
-    try:
-        print(f"  Total: {result.testsRun}")
-        print(f"  ✅ Sucessos: {result.testsRun - len(result.failures) - len(result.errors)}")
-        print(f"  ❌ Falhas: {len(result.failures)}")
-        print(f"  ⚠️ Erros: {len(result.errors)}")
-        if result.wasSuccessful():
-            print("\n🎉 TODOS OS TESTES PASSARAM!")
-        else:
-            print("\n⚠️ ALGUNS TESTES FALHARAM")
-    except Exception:
-        print("⚠️ Resumo dos testes indisponível")
-    return result
-
-# ============================================================================
-# EXECUÇÃO PRINCIPAL
-# ============================================================================
-def print_intro():
-    """Imprime introdução"""
-    print("\n" + "="*80+ "\n")
-    print(" "*15 + "GLOBAL SOLUTION - MOTOR DE ORIENTAÇÃO DE HABILIDADES")
-    print(" "*25 + "Engenharia de Software")
-    print(" "*20 + "Programação Dinâmica - Novembro 2025\n")
-    print("="*80)
-    print("\n⏱️ Tempo estimado: 30-90 segundos")
-    print("-"*80)
-
-def run_all_with_visualizations():
-    """Executa todos os desafios COM visualizações e TESTES"""
-    start_time = time.time()
-    results = {}
-    try:
-        random.seed(GLOBAL_SEED)
-        np.random.seed(GLOBAL_SEED)
-        # DESAFIO 1
-        results['challenge1'] = run_challenge1_with_viz()
-        # DESAFIO 2
-        results['challenge2'] = run_challenge2_with_viz()
-        # DESAFIO 3
-        results['challenge3'] = run_challenge3_with_viz()
-        # DESAFIO 4
-        results['challenge4'] = run_challenge4_with_viz()
-        # DESAFIO 5
-        results['challenge5'] = run_challenge5_with_viz()
-        # TESTES
-        print("\n" + "="*80)
-        print_header("EXECUTANDO TESTES")
-        results['tests'] = run_tests()
-    except Exception as e:
-        print(f"\n❌ Erro: {e}")
-        import traceback
-        traceback.print_exc()
-    total_time = time.time() - start_time
-    # SUMÁRIO FINAL
-    print("\n" + "="*80)
-    print_header("SUMÁRIO DE EXECUÇÃO")
-    print(f"\n✅ {len(results)-1} desafio(s) executado(s) com sucesso!")  # -1 para não contar os testes
-    print(f"⏱️ Tempo total: {total_time:.2f}s")
-    print("\n📊 GRÁFICOS GERADOS:")
-    if IMPROVED_PLOTS:
-        print("  - desafio1_monte_carlo.png - Análise Monte Carlo completa")
-        print("  - desafio2_top3.png - Timeline detalhada (120 permutações)")
-        print("  - desafio3_complexity.png - Análise empírica de complexidade")
-        print("  - desafio4_sorting.png - Comparação de algoritmos de ordenação")
-        print("  - desafio5_recommendation.png - Análise de recomendações")
-    else:
-        print("  ⚠️ Visualizações desabilitadas") 
-    return results
-
-def main():
-    """Função principal"""
-    # Validação
-    try:
-        validate_database_inline()
-    except Exception as e:
-        print(f"❌ Erro na validação: {e}")
-        sys.exit(1)
-    if not CHALLENGES_AVAILABLE:
-        print("❌ Desafios não disponíveis!")
-        sys.exit(1)
-    print_intro()
-    print("\n🚀 Iniciando execução automática...")
-    print("   (Os gráficos serão exibidos E salvos automaticamente)")
-    print("\n" + "⏳"*40 + "\n")
-    results = run_all_with_visualizations()
-    return results
-
-if __name__ == "__main__":
-    main()
+import logging
+import sys
+import time
+import warnings
+# Filtros direcionados: silenciam só o ruído conhecido de bibliotecas,
+# sem esconder RuntimeWarnings legítimos dos cálculos
+warnings.filterwarnings('ignore', category=DeprecationWarning)
+warnings.filterwarnings('ignore', category=FutureWarning)
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# --interactive preserva o backend GUI e exibe as janelas dos gráficos;
+# no modo padrão (automatizado) força-se Agg: renderização sem GUI, segura
+# para threads de background e sem o custo de inicializar Tk/Qt
+INTERACTIVE_PLOTS = '--interactive' in sys.argv
+
+# --quiet eleva o nível do logger para WARNING: banners, cabeçalhos e os
+# relatórios dos desafios nem chegam a formatar suas strings (útil em CI
+# ou com stdout redirecionado)
+logging.basicConfig(format='%(message)s')
+log = logging.getLogger('gs2')
+log.setLevel(logging.WARNING if '--quiet' in sys.argv else logging.INFO)
+try:
+    import matplotlib
+    if not INTERACTIVE_PLOTS:
+        matplotlib.use('Agg')
+except ImportError:
+    pass
+
+from gs_config import print_header, SKILLS_DATABASE, SKILLS_VT_ARRAY
+
+# ============================================================================
+#   VALIDAÇÃO INLINE
+# ============================================================================
+# Conjunto de skills calculado uma única vez no import (a base é estática)
+ALL_SKILLS = frozenset(SKILLS_DATABASE)
+
+# Arrays auxiliares para validação vetorizada dos pré-requisitos
+_SKILL_IDS = np.sort(np.array(list(SKILLS_DATABASE)))
+_PREREQ_OWNERS = np.array(
+    [sid for sid, d in SKILLS_DATABASE.items() for _ in d['Pre_Reqs']]
+)
+_PREREQ_IDS = np.array(
+    [p for d in SKILLS_DATABASE.values() for p in d['Pre_Reqs']]
+)
+
+# Chaves de conteúdo já validadas (memoização entre chamadas de main())
+_VALIDATED_KEYS = set()
+
+def _database_content_key():
+    """Calcula uma chave de conteúdo da base de dados para memoização."""
+    return hash(tuple(sorted(
+        (sid, d['Valor'], d['Tempo'], d['Complexidade'], tuple(d['Pre_Reqs']))
+        for sid, d in SKILLS_DATABASE.items()
+    )))
+
+def validate_database_inline():
+    """Valida a base de dados inline (vetorizada e memoizada por conteúdo)."""
+    key = _database_content_key()
+    if key in _VALIDATED_KEYS:
+        return True
+    print("\n🔍 Validando base de dados...")
+    # Pré-requisitos: uma única passada vetorizada sobre todos os pares
+    known = np.isin(_PREREQ_IDS, _SKILL_IDS)
+    if not known.all():
+        bad = int(np.argmin(known))
+        raise ValueError(
+            f"Pré-requisito inválido: {_PREREQ_OWNERS[bad]} → {_PREREQ_IDS[bad]}"
+        )
+    # Valor/Tempo/Complexidade positivos: comparação em bloco na matriz (N, 3)
+    invalid_rows = (SKILLS_VT_ARRAY <= 0).any(axis=1)
+    if invalid_rows.any():
+        skill_id = list(SKILLS_DATABASE)[int(np.argmax(invalid_rows))]
+        raise ValueError(f"Valores inválidos em {skill_id}")
+    print("✅ Base de dados validada com sucesso!")
+    _VALIDATED_KEYS.add(key)
+    return True
+
+# ============================================================================
+# IMPORTAÇÕES DOS DESAFIOS (LAZY)
+# ============================================================================
+# Os módulos pesados (desafios com warmup JIT, visualização com matplotlib)
+# só são importados quando realmente usados; o import de main.py fica leve.
+from gs_config import (TARGET_SKILL, MAX_TIME, MAX_COMPLEXITY, N_MONTE_CARLO,
+                       CRITICAL_SKILLS, BASIC_SKILLS, MIN_ADAPTABILITY,
+                       GLOBAL_SEED)
+import random
+
+# Semeadura única no import: evita reinicializar o Mersenne Twister a cada
+# chamada de run_all em uso interativo. _RNG (Generator moderno) fica
+# disponível para amostragens vetorizadas nos desafios.
+random.seed(GLOBAL_SEED)
+np.random.seed(GLOBAL_SEED)
+_RNG = np.random.default_rng(GLOBAL_SEED)
+
+# None = ainda não tentado; True/False depois da primeira tentativa
+CHALLENGES_AVAILABLE = None
+
+def _challenges_importable():
+    """Importa os módulos de desafio sob demanda (uma única vez)."""
+    global CHALLENGES_AVAILABLE
+    if CHALLENGES_AVAILABLE is None:
+        try:
+            import gs_challenge1  # noqa: F401
+            import gs_challenge2  # noqa: F401
+            import gs_challenge3  # noqa: F401
+            import gs_challenge4  # noqa: F401
+            import gs_challenge5  # noqa: F401
+            CHALLENGES_AVAILABLE = True
+        except ImportError as e:
+            print(f"⚠️ Erro ao importar desafios: {e}")
+            CHALLENGES_AVAILABLE = False
+    return CHALLENGES_AVAILABLE
+
+# ============================================================================
+# IMPORTAÇÃO DE VISUALIZAÇÃO MELHORADA (LAZY)
+# ============================================================================
+IMPROVED_PLOTS = None
+
+def _get_visualization():
+    """Importa o módulo de visualização sob demanda (uma única vez)."""
+    global IMPROVED_PLOTS, ProfessionalVisualization
+    if IMPROVED_PLOTS is None:
+        try:
+            from gs_visualization import ImprovedVisualization
+            ProfessionalVisualization = ImprovedVisualization
+            IMPROVED_PLOTS = True
+            print("✅ Módulo de visualização carregado")
+        except ImportError:
+            IMPROVED_PLOTS = False
+            print("⚠️ Visualizações desabilitadas")
+    return ProfessionalVisualization if IMPROVED_PLOTS else None
+
+# Pool de 1 thread para gerar PNGs fora do caminho crítico (pyplot não é
+# thread-safe, então os gráficos são serializados dentro do worker)
+_plot_pool = ThreadPoolExecutor(max_workers=1)
+_PLOT_FUTURES = []
+
+def _submit_plot(plot_fn, **kwargs):
+    """Agenda um gráfico em background (ou renderiza direto se interativo)."""
+    if INTERACTIVE_PLOTS:
+        # GUI precisa rodar na thread principal
+        plot_fn(show=True, **kwargs)
+    else:
+        _PLOT_FUTURES.append(_plot_pool.submit(plot_fn, show=False, **kwargs))
+
+def _wait_for_plots():
+    """Aguarda a finalização dos gráficos enfileirados em background."""
+    for future in _PLOT_FUTURES:
+        try:
+            future.result()
+        except Exception as e:
+            print(f"⚠️ Erro ao gerar gráfico: {e}")
+    _PLOT_FUTURES.clear()
+
+
+# ============================================================================
+# IMPORTAÇÃO DE TESTES
+# ============================================================================
+try:
+    from gs_tests import run_tests_suite, validate_input_file
+    TESTS_AVAILABLE = True
+    print("✅ Módulo de testes carregado")
+except ImportError:
+    TESTS_AVAILABLE = False
+    print("⚠️ Testes desabilitados")
+
+# ============================================================================
+# EXECUÇÃO DOS DESAFIOS (FASE DE CÁLCULO)
+# ============================================================================
+# Cada desafio é dividido em duas fases:
+#   _compute_challengeN: só cálculo, retorna dict picklável (roda em worker)
+#   _report_challengeN:  prints e gráficos, sempre no processo principal
+# Isso permite rodar os cinco cálculos em paralelo via ProcessPoolExecutor.
+
+def _compute_challenge1():
+    """Calcula o Desafio 1 (DP + Monte Carlo), sem relatório."""
+    from gs_challenge1 import ImprovedMaxValuePathDP
+    solver = ImprovedMaxValuePathDP(SKILLS_DATABASE, TARGET_SKILL)
+    is_feasible, msg = solver.check_feasibility(MAX_TIME, MAX_COMPLEXITY)
+    if not is_feasible:
+        time_limit = solver.min_feasible_time + 50
+        complexity_limit = solver.min_feasible_complexity + 6
+    else:
+        time_limit = MAX_TIME
+        complexity_limit = MAX_COMPLEXITY
+    start = time.perf_counter()
+    mc_result = solver.solve_with_uncertainty(time_limit, complexity_limit, N_MONTE_CARLO)
+    mc_result['elapsed'] = time.perf_counter() - start
+    mc_result['is_feasible'] = is_feasible
+    mc_result['feasibility_msg'] = msg
+    mc_result['time_limit'] = time_limit
+    mc_result['complexity_limit'] = complexity_limit
+    return mc_result
+
+
+def _compute_challenge2():
+    """Calcula o Desafio 2 (120 permutações), sem relatório."""
+    from gs_challenge2 import ImprovedCriticalSkillsAnalyzer
+    analyzer = ImprovedCriticalSkillsAnalyzer(SKILLS_DATABASE, CRITICAL_SKILLS)
+    return analyzer.analyze_all_permutations()
+
+
+def _compute_challenge3():
+    """Calcula o Desafio 3 (guloso vs DP + análise empírica), sem relatório."""
+    from gs_challenge3 import ImprovedAdaptabilityOptimizer
+    optimizer = ImprovedAdaptabilityOptimizer(SKILLS_DATABASE, BASIC_SKILLS, MIN_ADAPTABILITY)
+    start = time.perf_counter()
+    greedy = optimizer.greedy_solution(verbose=False)
+    greedy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    dp = optimizer.optimal_solution_dp(verbose=False)
+    dp_time = time.perf_counter() - start
+    counter = optimizer.demonstrate_counterexample()
+    empirical = optimizer.empirical_complexity_analysis(max_size=12)
+    return {
+        'greedy': greedy,
+        'greedy_time': greedy_time,
+        'dp': dp,
+        'dp_time': dp_time,
+        'counter': counter,
+        'empirical': empirical
+    }
+
+
+def _compute_challenge4():
+    """Calcula o Desafio 4 (ordenação + benchmark), sem relatório."""
+    from gs_challenge4 import (ImprovedSortingAlgorithms, SprintDivider,
+                               benchmark_sorting)
+    # O benchmark de 100 rodadas domina o custo: roda em thread própria,
+    # sobreposto à ordenação e à divisão de sprints
+    with ThreadPoolExecutor(max_workers=1) as bench_pool:
+        bench_future = bench_pool.submit(benchmark_sorting, 100)
+        divider = SprintDivider(SKILLS_DATABASE)
+        data = divider.prepare_data()
+        sorted_data = ImprovedSortingAlgorithms.merge_sort(data)
+        sprints = divider.divide_sprints(sorted_data)
+        bench_results = bench_future.result()
+    return {
+        'sorted_data': sorted_data,
+        'sprints': sprints,
+        'benchmark': bench_results
+    }
+
+
+def _compute_challenge5():
+    """Calcula o Desafio 5 (recomendação gulosa vs DP), sem relatório."""
+    from gs_challenge5 import ImprovedSkillRecommender
+    recommender = ImprovedSkillRecommender(SKILLS_DATABASE)
+    current_profile = {'H1', 'H2', 'H3'}
+    greedy_result = recommender.recommend_greedy(current_profile, 3)
+    dp_result = recommender.recommend_with_dp(current_profile, max_time=5000)
+    return {
+        'profile': current_profile,
+        'greedy': greedy_result,
+        'dp': dp_result
+    }
+
+# ============================================================================
+# EXECUÇÃO DOS DESAFIOS (FASE DE RELATÓRIO E VISUALIZAÇÃO)
+# ============================================================================
+
+def _flush(lines):
+    """Emite as linhas acumuladas com uma única escrita em stdout."""
+    if lines and log.isEnabledFor(logging.INFO):
+        sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
+
+def _header(title):
+    """Imprime um cabeçalho, exceto em modo --quiet."""
+    if log.isEnabledFor(logging.INFO):
+        print_header(title)
+
+
+def _report_challenge1(mc_result):
+    """Relata o Desafio 1 com visualização completa"""
+    _header("DESAFIO 1: CAMINHO DE VALOR MÁXIMO")
+    lines = [f"\n📊 Viabilidade: {mc_result['feasibility_msg']}"]
+    if not mc_result['is_feasible']:
+        lines.append(f"\n⚙️ Usando limites ajustados: "
+                     f"T≤{mc_result['time_limit']}, C≤{mc_result['complexity_limit']}")
+    lines.append(f"\n🎲 Executando {N_MONTE_CARLO} simulações Monte Carlo...")
+    if mc_result['success']:
+        lines.append(f"\n✅ SOLUÇÃO ENCONTRADA (tempo: {mc_result['elapsed']:.2f}s):")
+        lines.append(f"  Caminho: {' → '.join(mc_result['path'])}")
+        lines.append(f"\n📊 RESULTADOS:")
+        lines.append(f"  Valor Determinístico: {mc_result['deterministic_value']}")
+        lines.append(f"  E[Valor]: {mc_result['expected_value']:.2f}")
+        lines.append(f"  σ(Valor): {mc_result['std_value']:.2f}")
+        lines.append(f"  Range: [{mc_result['min_value']:.2f}, {mc_result['max_value']:.2f}]")
+        lines.append(f"  CV: {(mc_result['std_value']/mc_result['expected_value'])*100:.2f}%")
+        lines.append(f"\n  Tempo Total: {mc_result['total_time']}h")
+        lines.append(f"  Complexidade Total: {mc_result['total_complexity']}")
+        _flush(lines)
+        viz = _get_visualization()
+        if viz:
+            if log.isEnabledFor(logging.INFO):
+                print("\n📈 Gerando visualização...")
+            _submit_plot(
+                viz.plot_monte_carlo_enhanced,
+                simulations=mc_result['simulations'],
+                deterministic_value=mc_result['deterministic_value'],
+                filename='desafio1_monte_carlo.png'
+            )
+        return mc_result
+    else:
+        lines.append(f"\n❌ Solução não encontrada")
+        _flush(lines)
+        return None
+
+def _report_challenge2(analysis):
+    """Relata o Desafio 2 com visualização"""
+    _header("DESAFIO 2: VERIFICAÇÃO CRÍTICA")
+    from gs_challenge2 import ImprovedCriticalSkillsAnalyzer
+    analyzer = ImprovedCriticalSkillsAnalyzer(SKILLS_DATABASE, CRITICAL_SKILLS)
+    print("\n🔗 Analisando dependências...")
+    analyzer.analyze_dependency_impact()
+    stats = analysis['statistics']
+    lines = [f"\n🔄 Analisando 120 permutações de {CRITICAL_SKILLS}..."]
+    lines.append(f"\n📊 ESTATÍSTICAS:")
+    lines.append(f"  Média: {stats['mean']:.2f}h")
+    lines.append(f"  Desvio Padrão: {stats['std']:.2f}h")
+    lines.append(f"  Mínimo: {stats['min']:.2f}h")
+    lines.append(f"  Máximo: {stats['max']:.2f}h")
+    lines.append(f"  Range: {stats['range']:.2f}h")
+    lines.append(f"\n🏆 TOP 3 ORDENS:")
+    for i, result in enumerate(analysis['top3'], 1):
+        lines.append(f"\n  #{i}: {' → '.join(result['order'])}")
+        lines.append(f"      Tempo Total: {result['total_time']}h")
+        lines.append(f"      Breakdown: {result['wait_time']}h (espera) + "
+                     f"{result['acquire_time']}h (críticas)")
+    heuristics = analyzer.identify_heuristics(analysis['top3'])
+    if heuristics:
+        lines.append(f"\n💡 HEURÍSTICAS IDENTIFICADAS:")
+        lines.extend(f"  • {h}" for h in heuristics)
+    _flush(lines)
+    viz = _get_visualization()
+    if viz:
+        if log.isEnabledFor(logging.INFO):
+            print("\n📈 Gerando visualização...")
+        _submit_plot(
+            viz.plot_top3_timeline_enhanced,
+            top3=analysis['top3'],
+            filename='desafio2_top3.png'
+        )
+    return analysis
+
+def _report_challenge3(computed):
+    """Relata o Desafio 3 com visualização"""
+    _header("DESAFIO 3: PIVÔ MAIS RÁPIDO")
+    greedy = computed['greedy']
+    dp = computed['dp']
+    lines = ["\n🔬 COMPARAÇÃO DE SOLUÇÕES:"]
+    lines.append(f"\n  GULOSO (V/T):")
+    lines.append(f"    Skills: {greedy['selected']}")
+    lines.append(f"    Tempo: {greedy['total_time']}h")
+    lines.append(f"    Valor: {greedy['total_value']}")
+    lines.append(f"    Execução: {computed['greedy_time']*1000:.3f}ms")
+    if dp:
+        lines.append(f"\n  ÓTIMO (DP):")
+        lines.append(f"    Skills: {dp['selected']}")
+        lines.append(f"    Tempo: {dp['total_time']}h")
+        lines.append(f"    Valor: {dp['total_value']}")
+        lines.append(f"    Execução: {computed['dp_time']*1000:.3f}ms")
+        if greedy['total_time'] == dp['total_time']:
+            lines.append(f"\n  ✅ Guloso encontrou solução ÓTIMA!")
+        else:
+            diff = greedy['total_time'] - dp['total_time']
+            pct = (diff / dp['total_time']) * 100
+            lines.append(f"\n  ⚠️ Guloso subótimo: +{diff}h (+{pct:.1f}%)")
+    lines.append("\n" + "="*80)
+    lines.append("CONTRAEXEMPLO: GULOSO NEM SEMPRE É ÓTIMO")
+    lines.append("="*80)
+    counter = computed['counter']
+    lines.append(f"\n{counter['explanation']}")
+    lines.append(f"\n  Guloso escolhe: {counter['greedy_solution']['choice']} → {counter['greedy_solution']['time']}h")
+    lines.append(f"  Ótimo é: {counter['optimal_solution']['choice']} → {counter['optimal_solution']['time']}h")
+    lines.append("\n📊 Análise empírica de complexidade...")
+    _flush(lines)
+    empirical = computed['empirical']
+    viz = _get_visualization()
+    if viz:
+        if log.isEnabledFor(logging.INFO):
+            print("\n📈 Gerando visualização...")
+        _submit_plot(
+            viz.plot_complexity_enhanced,
+            empirical_data=empirical,
+            filename='desafio3_complexity.png'
+        )
+    return {'greedy': greedy, 'dp': dp, 'empirical': empirical}
+
+def _report_challenge4(computed):
+    """Relata o Desafio 4 com visualização"""
+    _header("DESAFIO 4: TRILHAS PARALELAS")
+    from gs_challenge4 import SprintDivider
+    divider = SprintDivider(SKILLS_DATABASE)
+    sorted_data = computed['sorted_data']
+    sprints = computed['sprints']
+    bench_results = computed['benchmark']
+    # Alias local evita lookups globais repetidos dentro dos loops de print
+    nome_of = {k: v['Nome'] for k, v in SKILLS_DATABASE.items()}
+    lines = [f"\n📊 Total de habilidades: {len(sorted_data)}"]
+    lines.append("\n🔄 Ordenando com Merge Sort...")
+    lines.append("\n✅ Habilidades ordenadas por Complexidade:")
+    for i, (skill_id, complexity) in enumerate(sorted_data, 1):
+        lines.append(f"  {i:2d}. {skill_id} ({nome_of[skill_id]:30s}) - C={complexity}")
+    lines.append("\n📦 DIVISÃO EM SPRINTS:")
+    lines.append(f"\n  Sprint A (Skills 1-6):")
+    lines.extend(f"    • {skill_id}: {nome_of[skill_id]}"
+                 for skill_id in sprints['sprint_a']['skills'])
+    lines.append(f"\n  Sprint B (Skills 7-12):")
+    lines.extend(f"    • {skill_id}: {nome_of[skill_id]}"
+                 for skill_id in sprints['sprint_b']['skills'])
+    _flush(lines)
+    divider.analyze_sprint_balance(sprints)
+    lines.append("\n⏱️ Executando benchmark (100 rodadas)...")
+    lines.append("\n📊 RESULTADOS DO BENCHMARK:")
+    for algo, metrics in bench_results.items():
+        lines.append(f"  {algo:20s}: {metrics['mean']:.4f}ms "
+                     f"(min={metrics['min']:.4f}, max={metrics['max']:.4f})")
+    _flush(lines)
+    if log.isEnabledFor(logging.INFO):
+        divider.print_algorithm_justification()
+    viz = _get_visualization()
+    if viz:
+        if log.isEnabledFor(logging.INFO):
+            print("\n📈 Gerando visualização...")
+        try:
+            _submit_plot(
+                viz.plot_sorting_comparison,
+                benchmark_results=bench_results,
+                filename='desafio4_sorting.png'
+            )
+        except AttributeError:
+            print("⚠️ Método plot_sorting_comparison não disponível na classe de visualização")
+    return {'sprints': sprints, 'benchmark': bench_results}
+
+def _report_challenge5(computed):
+    """Relata o Desafio 5 com visualização"""
+    _header("DESAFIO 5: RECOMENDAÇÃO DE HABILIDADES")
+    from gs_challenge5 import ImprovedSkillRecommender
+    recommender = ImprovedSkillRecommender(SKILLS_DATABASE)
+    recommender.print_market_scenarios()
+    greedy_result = computed['greedy']
+    dp_result = computed['dp']
+    lines = [f"\n👤 PERFIL ATUAL: {sorted(computed['profile'])}"]
+    lines.append("\n🔬 Comparando abordagens: Guloso vs DP Verdadeiro...")
+    lines.append("\n📊 RESULTADOS:")
+    lines.append("\n  GULOSO (E[V]/T):")
+    for i, rec in enumerate(greedy_result['recommendations'], 1):
+        lines.append(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
+        lines.append(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h, Score={rec['score']:.4f}")
+    lines.append("\n  DP VERDADEIRO:")
+    if dp_result.get('recommendations'):
+        for i, rec in enumerate(dp_result['recommendations'], 1):
+            lines.append(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
+            lines.append(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h")
+        if 'optimal_path' in dp_result:
+            lines.append(f"\n  Path Ótimo: {' → '.join(dp_result['optimal_path'][:5])}...")
+            lines.append(f"  Valor Total: {dp_result.get('optimal_value', 0):.2f}")
+            lines.append(f"  Tempo Total: {dp_result.get('optimal_time', 0)}h")
+    else:
+        lines.append("    Nenhuma recomendação")
+    # Uma varredura por lista de recomendações; diferenças só são
+    # calculadas (e formatadas) no ramo em que realmente aparecem
+    g_ids = frozenset(r['skill_id'] for r in greedy_result['recommendations'])
+    d_ids = frozenset(r['skill_id'] for r in dp_result.get('recommendations', ()))
+    lines.append("\n💡 ANÁLISE:")
+    if g_ids == d_ids:
+        lines.append("  ✅ Guloso coincide com DP (neste caso)")
+    else:
+        lines.append(f"  ⚠️ Abordagens diferem")
+        lines.append(f"    Sobreposição: {set(g_ids & d_ids)}")
+        lines.append(f"    Apenas Guloso: {set(g_ids - d_ids)}")
+        lines.append(f"    Apenas DP: {set(d_ids - g_ids)}")
+    _flush(lines)
+    viz = _get_visualization()
+    if viz:
+        if log.isEnabledFor(logging.INFO):
+            print("\n📈 Gerando visualização...")
+        try:
+            _submit_plot(
+                viz.plot_recommendation_analysis,
+                greedy_result=greedy_result,
+                dp_result=dp_result,
+                filename='desafio5_recommendation.png'
+            )
+        except AttributeError:
+            print("⚠️ Método plot_recommendation_analysis não disponível na classe de visualização")
+    return {'greedy': greedy_result, 'dp': dp_result}
+
+# ============================================================================
+# EXECUÇÃO SEQUENCIAL (COMPATIBILIDADE)
+# ============================================================================
+
+def run_challenge1_with_viz():
+    """Executa Desafio 1 com visualização completa"""
+    return _report_challenge1(_compute_challenge1())
+
+def run_challenge2_with_viz():
+    """Executa Desafio 2 com visualização"""
+    return _report_challenge2(_compute_challenge2())
+
+def run_challenge3_with_viz():
+    """Executa Desafio 3 com visualização"""
+    return _report_challenge3(_compute_challenge3())
+
+def run_challenge4_with_viz():
+    """Executa Desafio 4 com visualização"""
+    return _report_challenge4(_compute_challenge4())
+
+def run_challenge5_with_viz():
+    """Executa Desafio 5 com visualização"""
+    return _report_challenge5(_compute_challenge5())
+
+# ============================================================================
+# FUNÇÃO PARA EXECUTAR TESTES
+# ============================================================================
+def run_tests():
+    """Executa a suite de testes"""
+    if not TESTS_AVAILABLE:
+        print("\n⚠️ Módulo de testes não disponível")
+        return None
+    print("\n📋 Validando gs_input_file...")
+    if hasattr(validate_input_file, '__call__'):
+        try:
+            if not validate_input_file():
+                print("❌ Validação falhou")
+                return None
+        except Exception as e:
+            print(f"❌ Erro na validação: {e}")
+            return None
+    print("\n🧪 Executando suite de testes...")
+    try:
+        result = run_tests_suite(verbosity=2)
+    except Exception as e:
+        print(f"❌ Erro na suíte de testes: {e}")
+        return None
+    print("\n📊 RESUMO DOS TESTES:")
+    try:
+        print(f"  Total: {result.testsRun}")
+        print(f"  ✅ Sucessos: {result.testsRun - len(result.failures) - len(result.errors)}")
+        print(f"  ❌ Falhas: {len(result.failures)}")
+        print(f"  ⚠️ Erros: {len(result.errors)}")
+        if result.wasSuccessful():
+            print("\n🎉 TODOS OS TESTES PASSARAM!")
+        else:
+            print("\n⚠️ ALGUNS TESTES FALHARAM")
+    except Exception:
+        print("⚠️ Resumo dos testes indisponível")
+    return result
+
+# ============================================================================
+# EXECUÇÃO PRINCIPAL
+# ============================================================================
+def print_intro():
+    """Imprime introdução"""
+    if not log.isEnabledFor(logging.INFO):
+        return
+    print("\n" + "="*80+ "\n")
+    print(" "*15 + "GLOBAL SOLUTION - MOTOR DE ORIENTAÇÃO DE HABILIDADES")
+    print(" "*25 + "Engenharia de Software")
+    print(" "*20 + "Programação Dinâmica - Novembro 2025\n")
+    print("="*80)
+    print("\n⏱️ Tempo estimado: 30-90 segundos")
+    print("-"*80)
+
+def _worker_init():
+    """Re-semeia os geradores aleatórios em cada processo worker."""
+    random.seed(GLOBAL_SEED)
+    np.random.seed(GLOBAL_SEED)
+
+# Pares (nome, cálculo, relatório) na ordem de apresentação dos desafios
+_CHALLENGE_PIPELINE = [
+    ('challenge1', _compute_challenge1, _report_challenge1),
+    ('challenge2', _compute_challenge2, _report_challenge2),
+    ('challenge3', _compute_challenge3, _report_challenge3),
+    ('challenge4', _compute_challenge4, _report_challenge4),
+    ('challenge5', _compute_challenge5, _report_challenge5),
+]
+
+def run_all_with_visualizations():
+    """Executa todos os desafios COM visualizações e TESTES"""
+    start_time = time.perf_counter()
+    results = {}
+    try:
+        # FASE 1: cálculos dos 5 desafios em paralelo (um processo por desafio)
+        computed = {}
+        try:
+            with ProcessPoolExecutor(max_workers=5,
+                                     initializer=_worker_init) as pool:
+                futures = {pool.submit(compute): name
+                           for name, compute, _ in _CHALLENGE_PIPELINE}
+                for future in as_completed(futures):
+                    computed[futures[future]] = future.result()
+        except Exception as e:
+            print(f"⚠️ Execução paralela indisponível ({e}) - usando modo serial")
+            computed = {name: compute()
+                        for name, compute, _ in _CHALLENGE_PIPELINE}
+        # FASE 2: relatórios e gráficos em ordem, no processo principal
+        for name, _, report in _CHALLENGE_PIPELINE:
+            results[name] = report(computed[name])
+        # TESTES
+        if log.isEnabledFor(logging.INFO):
+            print("\n" + "="*80)
+        _header("EXECUTANDO TESTES")
+        results['tests'] = run_tests()
+    except Exception as e:
+        print(f"\n❌ Erro: {e}")
+        import traceback
+        traceback.print_exc()
+    # Garante que todos os PNGs em background foram gravados
+    _wait_for_plots()
+    total_time = time.perf_counter() - start_time
+    # SUMÁRIO FINAL
+    if log.isEnabledFor(logging.INFO):
+        print("\n" + "="*80)
+    _header("SUMÁRIO DE EXECUÇÃO")
+    lines = [f"\n✅ {len(results)-1} desafio(s) executado(s) com sucesso!",  # -1 para não contar os testes
+             f"⏱️ Tempo total: {total_time:.2f}s",
+             "\n📊 GRÁFICOS GERADOS:"]
+    if IMPROVED_PLOTS:
+        lines.append("  - desafio1_monte_carlo.png - Análise Monte Carlo completa")
+        lines.append("  - desafio2_top3.png - Timeline detalhada (120 permutações)")
+        lines.append("  - desafio3_complexity.png - Análise empírica de complexidade")
+        lines.append("  - desafio4_sorting.png - Comparação de algoritmos de ordenação")
+        lines.append("  - desafio5_recommendation.png - Análise de recomendações")
+    else:
+        lines.append("  ⚠️ Visualizações desabilitadas")
+    _flush(lines)
+    return results
+
+def main():
+    """Função principal"""
+    # Validação
+    try:
+        validate_database_inline()
+    except Exception as e:
+        print(f"❌ Erro na validação: {e}")
+        sys.exit(1)
+    if not _challenges_importable():
+        print("❌ Desafios não disponíveis!")
+        sys.exit(1)
+    print_intro()
+    if log.isEnabledFor(logging.INFO):
+        print("\n🚀 Iniciando execução automática...")
+        print("   (Os gráficos serão exibidos E salvos automaticamente)")
+        print("\n" + "⏳"*40 + "\n")
+    results = run_all_with_visualizations()
+    return results
+
+if __name__ == "__main__":
+    main()
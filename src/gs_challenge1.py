@@ -1,349 +1,519 @@
-"""
-DESAFIO 1 — Caminho de Valor Máximo
-
-Objetivo: encontrar a sequência de habilidades (do estado atual até S6) que maximize o Valor
-Esperado sob restrições T ≤ 350h e Cumulativo de Complexidade C ≤ 30.
-
-Exigências técnicas:
-• Modelar como DP (knapsack multidimensional: tempo e complexidade).
-• Introduzir incerteza: simular V ~ Uniforme[V-10%, V+10%] em 1000 cenários (Monte Carlo).
-• Maximizar E[Valor total] e relatar desvio-padrão dos resultados.
-• Gerar também a solução determinística (sem incerteza) e comparar.
-"""
-
-import numpy as np
-import time
-import tracemalloc
-from typing import Dict, List, Tuple, Any, Set, Optional
-from collections import defaultdict
-
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("⚠️ Matplotlib não disponível - gráficos desabilitados")
-
-from gs_config import (SKILLS_DATABASE, MAX_TIME, MAX_COMPLEXITY,
-                       TARGET_SKILL, N_MONTE_CARLO, print_header, GLOBAL_SEED,
-                       TEMPO_MIN, COMPLEXIDADE_MIN, USE_RELAXED_CONSTRAINTS)
-
-
-class ImprovedMaxValuePathDP:
-    """
-    Solver otimizado com DP para knapsack multidimensional.
-
-    ALGORITMO DP - Knapsack Multidimensional:
-
-    Estado: dp[(t, c)] = lista de {valor, skills, path}
-
-    Transição:
-    Para cada skill s em ordem topológica:
-        Para cada estado (t, c):
-            Se pré-requisitos satisfeitos:
-                novo_estado = (t + T[s], c + C[s])
-                Se novo_estado viável:
-                    Adiciona {valor + V[s], skills ∪ {s}, path + [s]}
-
-    Complexidade: O(n × T × C × k) onde k = estados por célula
-    Espaço: O(T × C × k)
-    """
-
-    def __init__(self, skills_db: Dict, target: str, max_states_per_cell: int = 50):
-        self.skills_db = skills_db
-        self.target = target
-        self.max_states_per_cell = max_states_per_cell
-        self.required_skills = self._get_required_skills()
-        self.min_feasible_time, self.min_feasible_complexity = self._calculate_minimum_path()
-
-    def _get_required_skills(self) -> List[str]:
-        """Obtém todas as habilidades necessárias para atingir o alvo."""
-        required = set()
-        to_process = [self.target]
-
-        while to_process:
-            skill = to_process.pop()
-            if skill in required:
-                continue
-            required.add(skill)
-            to_process.extend(self.skills_db[skill]['Pre_Reqs'])
-
-        return list(required)
-
-    def _topological_sort(self) -> List[str]:
-        """Ordenação topológica das habilidades necessárias."""
-        in_degree = {skill: 0 for skill in self.required_skills}
-
-        for skill in self.required_skills:
-            for prereq in self.skills_db[skill]['Pre_Reqs']:
-                if prereq in in_degree:
-                    in_degree[skill] += 1
-
-        queue = [s for s in self.required_skills if in_degree[s] == 0]
-        result = []
-
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
-
-            for skill in self.required_skills:
-                if current in self.skills_db[skill]['Pre_Reqs']:
-                    in_degree[skill] -= 1
-                    if in_degree[skill] == 0:
-                        queue.append(skill)
-
-        return result
-
-    def _calculate_minimum_path(self) -> Tuple[int, int]:
-        """Calcula caminho mínimo necessário (sem otimização de valor)."""
-        acquired = set()
-        total_time = 0
-        total_complexity = 0
-
-        topo_order = self._topological_sort()
-
-        for skill_id in topo_order:
-            if skill_id not in acquired:
-                skill = self.skills_db[skill_id]
-                total_time += skill['Tempo']
-                total_complexity += skill['Complexidade']
-                acquired.add(skill_id)
-
-        return total_time, total_complexity
-
-    def _prune_dominated_states(self, states: List[Dict]) -> List[Dict]:
-        """
-        Poda mais agressiva de estados dominados.
-
-        MELHORIA: Mantém apenas top N estados por valor para economizar memória.
-        """
-        if len(states) <= self.max_states_per_cell:
-            return states
-
-        # Ordena por valor decrescente
-        states.sort(key=lambda x: x['valor'], reverse=True)
-
-        # Mantém apenas os melhores
-        pruned = states[:self.max_states_per_cell]
-
-        return pruned
-
-    def solve_deterministic(self, max_time: int, max_complexity: int) -> Dict:
-        """
-        Resolve o problema de forma determinística usando DP.
-
-        Returns:
-            Dict com solução ótima ou mensagem de erro
-        """
-        print("\n   Executando DP determinístico...")
-
-        # dp[(t, c)] = lista de estados não-dominados
-        dp = defaultdict(list)
-        dp[(0, 0)].append({'valor': 0, 'skills': frozenset(), 'path': []})
-
-        topo_order = self._topological_sort()
-
-        for skill_id in topo_order:
-            skill = self.skills_db[skill_id]
-            new_dp = defaultdict(list)
-
-            # Copia estados antigos
-            for key, states in dp.items():
-                new_dp[key].extend(states)
-
-            # Adiciona transições
-            for (t, c), states in dp.items():
-                for state in states:
-                    # Verifica pré-requisitos
-                    prereqs_satisfied = all(
-                        p in state['skills'] for p in skill['Pre_Reqs']
-                    )
-
-                    if not prereqs_satisfied or skill_id in state['skills']:
-                        continue
-
-                    new_t = t + skill['Tempo']
-                    new_c = c + skill['Complexidade']
-
-                    if new_t <= max_time and new_c <= max_complexity:
-                        new_state = {
-                            'valor': state['valor'] + skill['Valor'],
-                            'skills': state['skills'] | {skill_id},
-                            'path': state['path'] + [skill_id]
-                        }
-                        new_dp[(new_t, new_c)].append(new_state)
-
-            # Poda estados dominados
-            for key in new_dp:
-                new_dp[key] = self._prune_dominated_states(new_dp[key])
-
-            dp = new_dp
-
-        # Encontra melhor solução com target
-        best_value = -1
-        best_solution = None
-
-        for states in dp.values():
-            for state in states:
-                if self.target in state['skills'] and state['valor'] > best_value:
-                    best_value = state['valor']
-                    best_solution = state
-
-        if best_solution:
-            return {
-                'success': True,
-                'path': best_solution['path'],
-                'total_value': best_solution['valor'],
-                'total_time': sum(self.skills_db[s]['Tempo'] for s in best_solution['path']),
-                'total_complexity': sum(self.skills_db[s]['Complexidade'] for s in best_solution['path'])
-            }
-
-        return {
-            'success': False,
-            'message': f'Impossível atingir {self.target} com T≤{max_time}, C≤{max_complexity}'
-        }
-
-    def solve_with_uncertainty(self, max_time: int, max_complexity: int, 
-                               n_simulations: int = 1000) -> Dict:
-        """
-        Resolve com incerteza usando Monte Carlo.
-
-        MELHORIA: Adiciona análise estatística detalhada.
-        """
-        print(f"\n🏔️ Executando {n_simulations} simulações Monte Carlo...")
-
-        # Primeiro obtém solução determinística
-        det_solution = self.solve_deterministic(max_time, max_complexity)
-
-        if not det_solution['success']:
-            return det_solution
-
-        path = det_solution['path']
-        simulated_values = []
-
-        np.random.seed(GLOBAL_SEED)
-
-        for i in range(n_simulations):
-            total_value = 0
-            for skill_id in path:
-                base_value = self.skills_db[skill_id]['Valor']
-                # Valor varia ±10%
-                simulated_value = base_value * np.random.uniform(0.9, 1.1)
-                total_value += simulated_value
-
-            simulated_values.append(total_value)
-
-        return {
-            'success': True,
-            'path': path,
-            'deterministic_value': det_solution['total_value'],
-            'expected_value': np.mean(simulated_values),
-            'std_value': np.std(simulated_values),
-            'min_value': np.min(simulated_values),
-            'max_value': np.max(simulated_values),
-            'simulations': simulated_values,
-            'total_time': det_solution['total_time'],
-            'total_complexity': det_solution['total_complexity']
-        }
-
-    def plot_monte_carlo_distribution(self, simulations: List[float], 
-                                      filename: str = 'desafio1_monte_carlo.png'):
-        """
-        MELHORIA: Visualiza distribuição Monte Carlo.
-        """
-        if not MATPLOTLIB_AVAILABLE:
-            print("⚠️ matplotlib não disponível - pulando gráfico")
-            return
-
-        plt.figure(figsize=(10, 6))
-        plt.hist(simulations, bins=50, alpha=0.7, color='#2E86AB', edgecolor='black')
-
-        mean_val = np.mean(simulations)
-        std_val = np.std(simulations)
-
-        plt.axvline(mean_val, color='red', linestyle='--', linewidth=2, 
-                   label=f'Média: {mean_val:.2f}')
-        plt.axvline(mean_val - std_val, color='orange', linestyle=':', linewidth=1.5,
-                   label=f'±1σ: [{mean_val-std_val:.2f}, {mean_val+std_val:.2f}]')
-        plt.axvline(mean_val + std_val, color='orange', linestyle=':', linewidth=1.5)
-
-        plt.xlabel('Valor Total')
-        plt.ylabel('Frequência')
-        plt.title('Distribuição de Valores - Simulação Monte Carlo (n=1000)')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300)
-        print(f"✅ Gráfico salvo: {filename}")
-        plt.close()
-
-    def check_feasibility(self, max_time: int, max_complexity: int) -> Tuple[bool, str]:
-        """Verifica viabilidade das restrições."""
-        if self.min_feasible_time <= max_time and self.min_feasible_complexity <= max_complexity:
-            return True, "Restrições viáveis"
-
-        return False, (f"Restrições muito rígidas! "
-                      f"Mínimo necessário: T≥{self.min_feasible_time}, "
-                      f"C≥{self.min_feasible_complexity}")
-
-
-def run_challenge1():
-    """Executa Desafio 1 completo com todas as melhorias."""
-    print_header("1️⃣ DESAFIO 1: CAMINHO DE VALOR MÁXIMO")
-
-    solver = ImprovedMaxValuePathDP(SKILLS_DATABASE, TARGET_SKILL)
-
-    # Verifica viabilidade
-    is_feasible, msg = solver.check_feasibility(MAX_TIME, MAX_COMPLEXITY)
-    print(f"\n📊 Viabilidade: {msg}")
-
-    # Usa limites ajustados se necessário
-    if USE_RELAXED_CONSTRAINTS and not is_feasible:
-        time_limit = solver.min_feasible_time + 50
-        complexity_limit = solver.min_feasible_complexity + 6
-        print(f"\n⚙️ Usando limites ajustados: T≤{time_limit}, C≤{complexity_limit}")
-    else:
-        time_limit = MAX_TIME
-        complexity_limit = MAX_COMPLEXITY
-
-    # Solução determinística
-    start = time.time()
-    det_result = solver.solve_deterministic(time_limit, complexity_limit)
-    det_time = time.time() - start
-
-    if det_result['success']:
-        print(f"\n✅ SOLUÇÃO DETERMINÍSTICA (tempo: {det_time:.4f}s):")
-        print(f"  Caminho: {' → '.join(det_result['path'])}")
-        print(f"  Valor Total: {det_result['total_value']}")
-        print(f"  Tempo: {det_result['total_time']}h")
-        print(f"  Complexidade: {det_result['total_complexity']}")
-    else:
-        print(f"\n❌ {det_result['message']}")
-        return
-
-    # Monte Carlo
-    start = time.time()
-    mc_result = solver.solve_with_uncertainty(time_limit, complexity_limit, N_MONTE_CARLO)
-    mc_time = time.time() - start
-
-    print(f"\n🎲 ANÁLISE MONTE CARLO (tempo: {mc_time:.4f}s):")
-    print(f"  E[Valor]: {mc_result['expected_value']:.2f}")
-    print(f"  σ(Valor): {mc_result['std_value']:.2f}")
-    print(f"  Range: [{mc_result['min_value']:.2f}, {mc_result['max_value']:.2f}]")
-    print(f"  Coef. Variação: {mc_result['std_value']/mc_result['expected_value']*100:.2f}%")
-
-    # Comparação
-    diff = mc_result['expected_value'] - det_result['total_value']
-    print(f"\n📊 COMPARAÇÃO:")
-    print(f"  Determinístico: {det_result['total_value']}")
-    print(f"  Estocástico E[V]: {mc_result['expected_value']:.2f}")
-    print(f"  Diferença: {diff:+.2f} ({diff/det_result['total_value']*100:+.2f}%)")
-
-    # Gera gráfico
-    solver.plot_monte_carlo_distribution(mc_result['simulations'])
-
-    return mc_result
-
-
-if __name__ == "__main__":
-    run_challenge1()
+"""
+DESAFIO 1 — Caminho de Valor Máximo
+
+Objetivo: encontrar a sequência de habilidades (do estado atual até S6) que maximize o Valor
+Esperado sob restrições T ≤ 350h e Cumulativo de Complexidade C ≤ 30.
+
+Exigências técnicas:
+• Modelar como DP (knapsack multidimensional: tempo e complexidade).
+• Introduzir incerteza: simular V ~ Uniforme[V-10%, V+10%] em 1000 cenários (Monte Carlo).
+• Maximizar E[Valor total] e relatar desvio-padrão dos resultados.
+• Gerar também a solução determinística (sem incerteza) e comparar.
+"""
+
+import numpy as np
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Tuple, Any, Set, Optional
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import matplotlib.pyplot as plt
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+    print("⚠️ Matplotlib não disponível - gráficos desabilitados")
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from gs_config import (SKILLS_DATABASE, MAX_TIME, MAX_COMPLEXITY,
+                       TARGET_SKILL, N_MONTE_CARLO, print_header, GLOBAL_SEED,
+                       TEMPO_MIN, COMPLEXIDADE_MIN, USE_RELAXED_CONSTRAINTS)
+
+# Abaixo deste n, o overhead de criar processos supera o ganho do paralelismo
+_MC_PARALLEL_THRESHOLD = 10_000
+_MC_CHUNK = 10_000
+
+
+def _simulate_chunk(base_values: np.ndarray, n: int, seed) -> np.ndarray:
+    """Gera n totais simulados com um Generator semeado (picklável)."""
+    rng = np.random.default_rng(seed)
+    mults = rng.uniform(0.9, 1.1, size=(n, base_values.size))
+    return mults @ base_values
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _mc_sample(base_values, out, seed):
+        """
+        Kernel compilado (Numba) para a amostragem Monte Carlo.
+
+        Simula len(out) totais com Valor ~ Uniforme[0.9V, 1.1V] por skill,
+        escrevendo direto no buffer pré-alocado `out` (sem alocação extra).
+        cache=True evita recompilar a cada execução do programa.
+        """
+        np.random.seed(seed)
+        for i in range(out.shape[0]):
+            total = 0.0
+            for j in range(base_values.shape[0]):
+                total += base_values[j] * np.random.uniform(0.9, 1.1)
+            out[i] = total
+
+
+class ImprovedMaxValuePathDP:
+    """
+    Solver otimizado com DP para knapsack multidimensional.
+
+    ALGORITMO DP - Knapsack Multidimensional:
+
+    Estado: dp[(t, c)] = índices em arrays paralelos (valor, bitmask de
+    skills, back-pointers para reconstrução do caminho)
+
+    Transição:
+    Para cada skill s em ordem topológica:
+        Para cada estado (t, c):
+            Se pré-requisitos satisfeitos:
+                novo_estado = (t + T[s], c + C[s])
+                Se novo_estado viável:
+                    Adiciona {valor + V[s], skills ∪ {s}, path + [s]}
+
+    Complexidade: O(n × T × C × k) onde k = estados por célula
+    Espaço: O(T × C × k)
+    """
+
+    def __init__(self, skills_db: Dict, target: str, max_states_per_cell: int = 50):
+        self.skills_db = skills_db
+        self.target = target
+        self.max_states_per_cell = max_states_per_cell
+        self.required_skills = self._get_required_skills()
+        self._topo_order = None
+        self._topological_sort()
+        # Índice inteiro por skill e máscaras de pré-requisitos, calculados
+        # uma única vez: o loop interno do DP só faz operações de bits
+        self.skill_idx = {s: i for i, s in enumerate(self._topo_order)}
+        # Colunas SoA da base (indexadas pelo id topológico): os caminhos
+        # quentes leem arrays contíguos em vez de dicts aninhados
+        self.tempo = np.array([skills_db[s]['Tempo'] for s in self._topo_order],
+                              dtype=np.int32)
+        self.cplx = np.array([skills_db[s]['Complexidade'] for s in self._topo_order],
+                             dtype=np.int32)
+        self.valor = np.array([skills_db[s]['Valor'] for s in self._topo_order],
+                              dtype=np.int32)
+        self.min_feasible_time, self.min_feasible_complexity = self._calculate_minimum_path()
+        self.prereq_mask = {
+            s: sum(1 << self.skill_idx[p]
+                   for p in skills_db[s]['Pre_Reqs'] if p in self.skill_idx)
+            for s in self._topo_order
+        }
+        # Transição parcialmente avaliada: as constantes de cada skill
+        # (bit, máscara de pré-reqs, ΔT, ΔC, ΔV) viram uma tupla pronta,
+        # eliminando todos os acessos a dict do loop quente do DP
+        self._transitions = [
+            (idx, 1 << idx, self.prereq_mask[s],
+             skills_db[s]['Tempo'], skills_db[s]['Complexidade'],
+             skills_db[s]['Valor'])
+            for idx, s in enumerate(self._topo_order)
+        ]
+        # Memoização do DP por (max_time, max_complexity): a passada
+        # estocástica reusa a solução determinística sem repetir o DP
+        self._det_cache = {}
+
+    def _get_required_skills(self) -> List[str]:
+        """Obtém todas as habilidades necessárias para atingir o alvo."""
+        required = set()
+        to_process = [self.target]
+
+        while to_process:
+            skill = to_process.pop()
+            if skill in required:
+                continue
+            required.add(skill)
+            to_process.extend(self.skills_db[skill]['Pre_Reqs'])
+
+        return list(required)
+
+    def _topological_sort(self) -> List[str]:
+        """Ordenação topológica das habilidades necessárias (Kahn).
+
+        Usa deque + adjacência reversa pré-computada: cada aresta é
+        visitada uma única vez, em vez de varrer todas as skills a cada
+        desempilhamento. O resultado é memoizado em self._topo_order.
+        """
+        if self._topo_order is not None:
+            return self._topo_order
+
+        in_degree = {skill: 0 for skill in self.required_skills}
+        children = defaultdict(list)
+
+        for skill in self.required_skills:
+            for prereq in self.skills_db[skill]['Pre_Reqs']:
+                if prereq in in_degree:
+                    in_degree[skill] += 1
+                    children[prereq].append(skill)
+
+        queue = deque(s for s in self.required_skills if in_degree[s] == 0)
+        result = []
+
+        while queue:
+            current = queue.popleft()
+            result.append(current)
+
+            for child in children[current]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        self._topo_order = result
+        return result
+
+    def _calculate_minimum_path(self) -> Tuple[int, int]:
+        """Calcula caminho mínimo necessário (sem otimização de valor).
+
+        A ordem topológica cobre cada skill necessária exatamente uma vez,
+        então o mínimo é a soma direta das colunas.
+        """
+        return int(self.tempo.sum()), int(self.cplx.sum())
+
+    def _prune_dominated_states(self, indices: List[int], valor: List[int],
+                                skillmask: List[int]) -> List[int]:
+        """
+        Poda por dominância de Pareto dentro da célula.
+
+        Um estado é dominado sse outro estado da mesma célula (t, c) tem
+        valor ≥ E skills ⊇ (superset testado por bits). Isso descarta só
+        estados comprovadamente inúteis — diferente do corte cego por
+        ranking de valor, que podia jogar fora estados de valor baixo mas
+        necessários para alcançar o alvo. O top-K fica como rede de
+        segurança caso a fronteira ainda exceda max_states_per_cell.
+        """
+        if len(indices) <= 1:
+            return indices
+
+        # Valor decrescente: um estado só pode ser dominado por anteriores
+        indices = sorted(indices, key=valor.__getitem__, reverse=True)
+        kept = []
+        for i in indices:
+            m = skillmask[i]
+            dominated = False
+            for j in kept:
+                if (skillmask[j] & m) == m:
+                    dominated = True
+                    break
+            if not dominated:
+                kept.append(i)
+
+        return kept[:self.max_states_per_cell]
+
+    def solve_deterministic(self, max_time: int, max_complexity: int) -> Dict:
+        """
+        Resolve o problema de forma determinística usando DP.
+
+        Returns:
+            Dict com solução ótima ou mensagem de erro
+        """
+        cached = self._det_cache.get((max_time, max_complexity))
+        if cached is not None:
+            return cached
+
+        print("\n   Executando DP determinístico...")
+
+        topo_order = self._topo_order
+
+        # Layout SoA: em vez de um dict {'valor', 'skills', 'path'} por
+        # estado, quatro arrays paralelos de primitivos indexados pelo id
+        # do estado. Conjuntos de skills viram bitmask (k ≤ 64) e o path
+        # fica implícito nos back-pointers (parent, last_skill) — só é
+        # reconstruído para o estado vencedor.
+        skill_idx = self.skill_idx
+        valor = [0]
+        skillmask = [0]
+        parent = [-1]
+        last_skill = [-1]
+
+        # dp[(t, c)] = índices dos estados não-dominados da célula
+        dp = defaultdict(list)
+        dp[(0, 0)].append(0)
+
+        # Bound de admissibilidade (branch-and-bound): custo de sufixo das
+        # skills ainda não processadas na ordem topológica. Todas as skills
+        # do fechamento são obrigatórias para alcançar o alvo, então um
+        # estado que não couber com o sufixo restante — ou que tenha pulado
+        # uma skill já processada — nunca chega ao alvo
+        n = len(self._transitions)
+        suffix_t = [0] * (n + 1)
+        suffix_c = [0] * (n + 1)
+        for k in range(n - 1, -1, -1):
+            suffix_t[k] = suffix_t[k + 1] + self._transitions[k][3]
+            suffix_c[k] = suffix_c[k + 1] + self._transitions[k][4]
+
+        for s_idx, s_bit, s_prereqs, dt, dc, dv in self._transitions:
+
+            # Transições acumuladas num buffer à parte: dp segue sendo a
+            # tabela viva (nada de copiar todas as células a cada skill) e
+            # o buffer garante que não se leia um estado recém-criado
+            # ainda dentro da varredura da mesma skill
+            additions = defaultdict(list)
+            for (t, c), indices in dp.items():
+                new_t = t + dt
+                new_c = c + dc
+                if new_t > max_time or new_c > max_complexity:
+                    continue
+
+                for i in indices:
+                    mask = skillmask[i]
+                    # Pré-requisitos e "já adquirida" em duas operações de bits
+                    if (mask & s_prereqs) != s_prereqs or mask & s_bit:
+                        continue
+
+                    additions[(new_t, new_c)].append(len(valor))
+                    valor.append(valor[i] + dv)
+                    skillmask.append(mask | s_bit)
+                    parent.append(i)
+                    last_skill.append(s_idx)
+
+            # Mescla e poda apenas as células efetivamente alteradas
+            for key, new_indices in additions.items():
+                cell = dp[key]
+                cell.extend(new_indices)
+                dp[key] = self._prune_dominated_states(cell, valor, skillmask)
+
+            # Elimina células/estados que já não alcançam o alvo
+            prefix_mask = (s_bit << 1) - 1
+            rem_t = suffix_t[s_idx + 1]
+            rem_c = suffix_c[s_idx + 1]
+            for key in list(dp):
+                t, c = key
+                if t + rem_t > max_time or c + rem_c > max_complexity:
+                    del dp[key]
+                    continue
+                alive = [i for i in dp[key]
+                         if (skillmask[i] & prefix_mask) == prefix_mask]
+                if alive:
+                    dp[key] = alive
+                else:
+                    del dp[key]
+
+        # Encontra melhor solução com target
+        target_bit = 1 << skill_idx[self.target]
+        best_value = -1
+        best_idx = -1
+        best_tc = (0, 0)
+
+        for (t, c), indices in dp.items():
+            for i in indices:
+                if skillmask[i] & target_bit and valor[i] > best_value:
+                    best_value = valor[i]
+                    best_idx = i
+                    best_tc = (t, c)
+
+        if best_idx >= 0:
+            # Reconstrói o caminho percorrendo os back-pointers
+            path = []
+            i = best_idx
+            while i > 0:
+                path.append(topo_order[last_skill[i]])
+                i = parent[i]
+            path.reverse()
+            # A própria chave (t, c) da célula vencedora já é a soma de
+            # tempo/complexidade do caminho — sem re-somar sobre o path
+            result = {
+                'success': True,
+                'path': path,
+                'total_value': best_value,
+                'total_time': best_tc[0],
+                'total_complexity': best_tc[1]
+            }
+        else:
+            result = {
+                'success': False,
+                'message': f'Impossível atingir {self.target} com T≤{max_time}, C≤{max_complexity}'
+            }
+
+        self._det_cache[(max_time, max_complexity)] = result
+        return result
+
+    def solve_with_uncertainty(self, max_time: int, max_complexity: int, 
+                               n_simulations: int = 1000,
+                               return_samples: bool = True) -> Dict:
+        """
+        Resolve com incerteza usando Monte Carlo.
+
+        MELHORIA: Adiciona análise estatística detalhada. Com
+        return_samples=False, apenas as estatísticas agregadas são
+        retornadas e o buffer de simulações é liberado — útil quando o
+        histograma não será plotado.
+        """
+        print(f"\n🏔️ Executando {n_simulations} simulações Monte Carlo...")
+
+        # Primeiro obtém solução determinística
+        det_solution = self.solve_deterministic(max_time, max_complexity)
+
+        if not det_solution['success']:
+            return det_solution
+
+        path = det_solution['path']
+        # Valores do caminho fatiados da coluna SoA, sem lookups de dict
+        base_values = self.valor[
+            np.fromiter((self.skill_idx[s] for s in path),
+                        dtype=np.int64, count=len(path))
+        ].astype(np.float64)
+
+        # Buffer float32 mapeado em disco: mantém o pico de RAM baixo para
+        # N_MONTE_CARLO grande (o plot lê fatias via page cache)
+        sims_path = os.path.join(tempfile.gettempdir(), 'mc_sims.dat')
+        simulated_values = np.memmap(sims_path, dtype=np.float32,
+                                     mode='w+', shape=(n_simulations,))
+
+        if NUMBA_AVAILABLE and n_simulations < _MC_PARALLEL_THRESHOLD:
+            # Loop de amostragem compilado escrevendo in-place no buffer
+            _mc_sample(base_values, np.asarray(simulated_values), GLOBAL_SEED)
+        elif n_simulations < _MC_PARALLEL_THRESHOLD:
+            # Sorteio único vetorizado: uma matriz (n_simulations, |path|)
+            # de multiplicadores ±10% reduzida por broadcasting, no lugar
+            # do duplo loop interpretado simulação × skill
+            simulated_values[:] = _simulate_chunk(base_values, n_simulations,
+                                                  GLOBAL_SEED)
+        else:
+            # n grande: divide em chunks de tamanho fixo com seeds derivadas
+            # de SeedSequence — o resultado independe do número de workers
+            n_chunks = -(-n_simulations // _MC_CHUNK)
+            seeds = np.random.SeedSequence(GLOBAL_SEED).spawn(n_chunks)
+            with ProcessPoolExecutor() as pool:
+                futures = [
+                    pool.submit(_simulate_chunk, base_values,
+                                min(_MC_CHUNK, n_simulations - k * _MC_CHUNK),
+                                seeds[k])
+                    for k in range(n_chunks)
+                ]
+                offset = 0
+                for future in futures:
+                    chunk = future.result()
+                    simulated_values[offset:offset + chunk.size] = chunk
+                    offset += chunk.size
+
+        # Estatísticas em uma passada vetorizada sobre o buffer; o array
+        # completo só segue adiante se o chamador for plotar
+        result = {
+            'success': True,
+            'path': path,
+            'deterministic_value': det_solution['total_value'],
+            'expected_value': np.mean(simulated_values),
+            'std_value': np.std(simulated_values),
+            'min_value': np.min(simulated_values),
+            'max_value': np.max(simulated_values),
+            'simulations': simulated_values if return_samples else None,
+            'total_time': det_solution['total_time'],
+            'total_complexity': det_solution['total_complexity']
+        }
+        if not return_samples:
+            del simulated_values
+        return result
+
+    def plot_monte_carlo_distribution(self, simulations: List[float], 
+                                      filename: str = 'desafio1_monte_carlo.png'):
+        """
+        MELHORIA: Visualiza distribuição Monte Carlo.
+        """
+        if not MATPLOTLIB_AVAILABLE:
+            print("⚠️ matplotlib não disponível - pulando gráfico")
+            return
+
+        plt.figure(figsize=(10, 6))
+        plt.hist(simulations, bins=50, alpha=0.7, color='#2E86AB', edgecolor='black')
+
+        mean_val = np.mean(simulations)
+        std_val = np.std(simulations)
+
+        plt.axvline(mean_val, color='red', linestyle='--', linewidth=2, 
+                   label=f'Média: {mean_val:.2f}')
+        plt.axvline(mean_val - std_val, color='orange', linestyle=':', linewidth=1.5,
+                   label=f'±1σ: [{mean_val-std_val:.2f}, {mean_val+std_val:.2f}]')
+        plt.axvline(mean_val + std_val, color='orange', linestyle=':', linewidth=1.5)
+
+        plt.xlabel('Valor Total')
+        plt.ylabel('Frequência')
+        plt.title('Distribuição de Valores - Simulação Monte Carlo (n=1000)')
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        plt.savefig(filename, dpi=300)
+        print(f"✅ Gráfico salvo: {filename}")
+        plt.close()
+
+    def check_feasibility(self, max_time: int, max_complexity: int) -> Tuple[bool, str]:
+        """Verifica viabilidade das restrições."""
+        if self.min_feasible_time <= max_time and self.min_feasible_complexity <= max_complexity:
+            return True, "Restrições viáveis"
+
+        return False, (f"Restrições muito rígidas! "
+                      f"Mínimo necessário: T≥{self.min_feasible_time}, "
+                      f"C≥{self.min_feasible_complexity}")
+
+
+def run_challenge1():
+    """Executa Desafio 1 completo com todas as melhorias."""
+    print_header("1️⃣ DESAFIO 1: CAMINHO DE VALOR MÁXIMO")
+
+    solver = ImprovedMaxValuePathDP(SKILLS_DATABASE, TARGET_SKILL)
+
+    # Verifica viabilidade
+    is_feasible, msg = solver.check_feasibility(MAX_TIME, MAX_COMPLEXITY)
+    print(f"\n📊 Viabilidade: {msg}")
+
+    # Usa limites ajustados se necessário
+    if USE_RELAXED_CONSTRAINTS and not is_feasible:
+        time_limit = solver.min_feasible_time + 50
+        complexity_limit = solver.min_feasible_complexity + 6
+        print(f"\n⚙️ Usando limites ajustados: T≤{time_limit}, C≤{complexity_limit}")
+    else:
+        time_limit = MAX_TIME
+        complexity_limit = MAX_COMPLEXITY
+
+    # Solução determinística
+    start = time.time()
+    det_result = solver.solve_deterministic(time_limit, complexity_limit)
+    det_time = time.time() - start
+
+    if det_result['success']:
+        print(f"\n✅ SOLUÇÃO DETERMINÍSTICA (tempo: {det_time:.4f}s):")
+        print(f"  Caminho: {' → '.join(det_result['path'])}")
+        print(f"  Valor Total: {det_result['total_value']}")
+        print(f"  Tempo: {det_result['total_time']}h")
+        print(f"  Complexidade: {det_result['total_complexity']}")
+    else:
+        print(f"\n❌ {det_result['message']}")
+        return
+
+    # Monte Carlo
+    start = time.time()
+    mc_result = solver.solve_with_uncertainty(time_limit, complexity_limit, N_MONTE_CARLO)
+    mc_time = time.time() - start
+
+    print(f"\n🎲 ANÁLISE MONTE CARLO (tempo: {mc_time:.4f}s):")
+    print(f"  E[Valor]: {mc_result['expected_value']:.2f}")
+    print(f"  σ(Valor): {mc_result['std_value']:.2f}")
+    print(f"  Range: [{mc_result['min_value']:.2f}, {mc_result['max_value']:.2f}]")
+    print(f"  Coef. Variação: {mc_result['std_value']/mc_result['expected_value']*100:.2f}%")
+
+    # Comparação
+    diff = mc_result['expected_value'] - det_result['total_value']
+    print(f"\n📊 COMPARAÇÃO:")
+    print(f"  Determinístico: {det_result['total_value']}")
+    print(f"  Estocástico E[V]: {mc_result['expected_value']:.2f}")
+    print(f"  Diferença: {diff:+.2f} ({diff/det_result['total_value']*100:+.2f}%)")
+
+    # Gera gráfico
+    solver.plot_monte_carlo_distribution(mc_result['simulations'])
+
+    return mc_result
+
+
+if __name__ == "__main__":
+    run_challenge1()
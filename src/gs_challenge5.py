@@ -1,361 +1,592 @@
-"""
-Desafio 5 — Recomendar Próximas Habilidades
-
-Objetivo: dado um perfil atual e um horizonte de 5 anos, sugerir as próximas 2–3 habilidades
-maximizando o valor esperado, considerando transições de mercado (probabilidades
-fornecidas por você ou simuladas).
-
-Sugestão técnica: usar DP em horizonte finito ou busca com “look ahead”, ponderando
-probabilidades de cenário.
-"""
-
-import numpy as np
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
-
-from gs_config import SKILLS_DATABASE, print_header, GLOBAL_SEED
-
-
-class ImprovedSkillRecommender:
-    """
-    ALGORITMO DP:
-
-    Estado: dp[t][frozenset(skills)] = (valor_esperado_máximo, path)
-
-    Transição:
-    Para cada tempo t:
-        Para cada conjunto de skills:
-            Para cada skill disponível h:
-                novo_tempo = t + tempo[h]
-                novo_skills = skills ∪ {h}
-                novo_valor = valor_atual + E[V(h, cenário)] × desconto^(t/2000)
-
-                Se melhor: dp[novo_tempo][novo_skills] = (novo_valor, path + [h])
-
-    Complexidade: O(T × 2^n × n) onde T = horizonte em horas, n = número de skills
-    """
-
-    def __init__(self, skills_db: Dict):
-        self.skills_db = skills_db
-        self.market_scenarios = self._define_market_scenarios()
-
-    def _define_market_scenarios(self) -> Dict:
-        """Define cenários de mercado."""
-        return {
-            'scenarios': {
-                'AI_Boom': {
-                    'prob': 0.4,
-                    'value_multiplier': {
-                        'S6': 1.5,  # IA Generativa
-                        'S4': 1.3,  # ML
-                        'H11': 1.2  # Big Data
-                    },
-                    'description': 'Explosão de IA e ML'
-                },
-                'Cloud_Native': {
-                    'prob': 0.35,
-                    'value_multiplier': {
-                        'S7': 1.4,  # Cloud
-                        'S9': 1.3,  # DevOps
-                        'S8': 1.2   # APIs
-                    },
-                    'description': 'Cloud-native dominante'
-                },
-                'Security_First': {
-                    'prob': 0.25,
-                    'value_multiplier': {
-                        'S5': 1.6,  # Cybersecurity
-                        'H12': 1.3  # Blockchain
-                    },
-                    'description': 'Foco em segurança'
-                }
-            },
-            'horizon_years': 5,
-            'discount_factor': 0.95  # Desconto anual
-        }
-
-    def _calculate_expected_value(self, skill_id: str, 
-                                  current_skills: Set[str],
-                                  years_ahead: int) -> float:
-        """
-        Calcula valor esperado de uma skill considerando cenários.
-
-        E[V] = Σ P(cenário) × V × multiplicador[cenário]
-        """
-        base_value = self.skills_db[skill_id]['Valor']
-        expected_value = 0
-
-        for scenario_name, scenario_data in self.market_scenarios['scenarios'].items():
-            prob = scenario_data['prob']
-            multiplier = scenario_data['value_multiplier'].get(skill_id, 1.0)
-
-            # Bônus por sinergia (skills relacionadas já adquiridas)
-            synergy_bonus = 1.0
-            for prereq in self.skills_db[skill_id]['Pre_Reqs']:
-                if prereq in current_skills:
-                    synergy_bonus += 0.05
-
-            scenario_value = base_value * multiplier * synergy_bonus
-            expected_value += prob * scenario_value
-
-        # Desconto temporal
-        discount = self.market_scenarios['discount_factor'] ** years_ahead
-
-        return expected_value * discount
-
-    def _get_available_skills(self, acquired: Set[str]) -> List[str]:
-        """Retorna skills cujos pré-requisitos estão satisfeitos."""
-        available = []
-
-        for skill_id in self.skills_db.keys():
-            if skill_id in acquired:
-                continue
-
-            prereqs = set(self.skills_db[skill_id]['Pre_Reqs'])
-            if prereqs.issubset(acquired):
-                available.append(skill_id)
-
-        return available
-
-    def recommend_greedy(self, current_profile: Set[str],
-                        num_recommendations: int = 3) -> Dict:
-        """
-        Abordagem GULOSA (baseline para comparação).
-
-        Seleciona skills com melhor score: E[V] / Tempo
-        """
-        available = self._get_available_skills(current_profile)
-
-        # Calcula scores
-        scores = []
-        for skill_id in available:
-            expected_val = self._calculate_expected_value(skill_id, current_profile, 1)
-            time = self.skills_db[skill_id]['Tempo']
-            score = expected_val / time
-
-            scores.append({
-                'skill_id': skill_id,
-                'skill_name': self.skills_db[skill_id]['Nome'],
-                'expected_value': expected_val,
-                'time': time,
-                'score': score
-            })
-
-        # Ordena por score
-        scores.sort(key=lambda x: x['score'], reverse=True)
-
-        return {
-            'algorithm': 'Guloso (E[V]/T)',
-            'recommendations': scores[:num_recommendations],
-            'all_scores': scores
-        }
-
-    def recommend_with_dp(self, current_profile: Set[str],
-                         max_time: int = 10000,
-                         discretization: int = 10) -> Dict:
-        """
-        Args:
-            current_profile: Skills já adquiridas
-            max_time: Horizonte de tempo (horas)
-            discretization: Passo de discretização (horas)
-
-        Returns:
-            Dict com path ótimo e recomendações
-        """
-        print(f"\n🧠 Executando DP verdadeiro (horizonte={max_time}h)...")
-
-        horizon_hours = min(max_time, self.market_scenarios['horizon_years'] * 2000)
-
-        # dp[tempo][frozenset(skills)] = (valor_esperado, path)
-        dp = defaultdict(lambda: {})
-        dp[0][frozenset(current_profile)] = (0, [])
-
-        # DP forward
-        processed_states = 0
-        for t in range(0, horizon_hours + 1, discretization):
-            if t not in dp:
-                continue
-
-            for skills_set, (current_value, path) in list(dp[t].items()):
-                available = self._get_available_skills(skills_set)
-
-                for skill_id in available:
-                    skill = self.skills_db[skill_id]
-                    new_t = t + skill['Tempo']
-
-                    if new_t > horizon_hours:
-                        continue
-
-                    # Calcula valor esperado com desconto temporal
-                    years_ahead = new_t / 2000
-                    expected_value = self._calculate_expected_value(
-                        skill_id, skills_set, int(years_ahead)
-                    )
-
-                    new_value = current_value + expected_value
-                    new_skills = skills_set | {skill_id}
-                    new_path = path + [skill_id]
-
-                    # Atualiza se melhor
-                    if (new_skills not in dp[new_t] or 
-                        new_value > dp[new_t][new_skills][0]):
-                        dp[new_t][new_skills] = (new_value, new_path)
-                        processed_states += 1
-
-        print(f"  Estados processados: {processed_states}")
-
-        # Encontra melhor solução
-        best_value = -1
-        best_solution = None
-        best_time = 0
-
-        for t in dp:
-            for skills_set, (value, path) in dp[t].items():
-                if value > best_value:
-                    best_value = value
-                    best_solution = (skills_set, path)
-                    best_time = t
-
-        if best_solution:
-            skills_set, path = best_solution
-            # Recomenda apenas os próximos 2-3
-            next_skills = [s for s in path if s not in current_profile][:3]
-
-            recommendations = []
-            for skill_id in next_skills:
-                recommendations.append({
-                    'skill_id': skill_id,
-                    'skill_name': self.skills_db[skill_id]['Nome'],
-                    'expected_value': self._calculate_expected_value(
-                        skill_id, current_profile, 1
-                    ),
-                    'time': self.skills_db[skill_id]['Tempo']
-                })
-
-            return {
-                'algorithm': 'DP Verdadeiro',
-                'recommendations': recommendations,
-                'optimal_path': path,
-                'optimal_value': best_value,
-                'optimal_time': best_time,
-                'num_new_skills': len([s for s in path if s not in current_profile])
-            }
-
-        return {
-            'algorithm': 'DP Verdadeiro',
-            'recommendations': [],
-            'message': 'Nenhuma solução encontrada'
-        }
-
-    def compare_approaches(self, current_profile: Set[str]):
-        """
-        Comparação entre Guloso e DP.
-        """
-        print("\n" + "="*80)
-        print("COMPARAÇÃO: GULOSO vs DP VERDADEIRO")
-        print("="*80)
-
-        # Guloso
-        print("\n🏃 Executando abordagem GULOSA...")
-        greedy_result = self.recommend_greedy(current_profile, 3)
-
-        # DP
-        dp_result = self.recommend_with_dp(current_profile, max_time=5000)
-
-        # Resultados
-        print("\n📊 RESULTADOS:")
-
-        print("\n  GULOSO (Score E[V]/T):")
-        for i, rec in enumerate(greedy_result['recommendations'], 1):
-            print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
-            print(f"       E[V]={rec['expected_value']:.2f}, "
-                  f"T={rec['time']}h, Score={rec['score']:.4f}")
-
-        print("\n  DP VERDADEIRO (Valor Esperado Ótimo):")
-        if dp_result['recommendations']:
-            for i, rec in enumerate(dp_result['recommendations'], 1):
-                print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
-                print(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h")
-
-            print(f"\n  Path Ótimo Completo: {' → '.join(dp_result['optimal_path'])}")
-            print(f"  Valor Total Ótimo: {dp_result['optimal_value']:.2f}")
-            print(f"  Tempo Total: {dp_result['optimal_time']}h")
-        else:
-            print("    Nenhuma recomendação")
-
-        # Análise
-        print("\n💡 ANÁLISE:")
-
-        greedy_ids = set(r['skill_id'] for r in greedy_result['recommendations'])
-        dp_ids = set(r['skill_id'] for r in dp_result['recommendations'])
-
-        if greedy_ids == dp_ids:
-            print("  ✅ Guloso coincide com DP (neste caso)")
-        else:
-            overlap = greedy_ids & dp_ids
-            print(f"  ⚠️ Abordagens diferem!")
-            print(f"    Sobreposição: {overlap}")
-            print(f"    Apenas Guloso: {greedy_ids - dp_ids}")
-            print(f"    Apenas DP: {dp_ids - greedy_ids}")
-
-        print("\n  📈 VANTAGENS DO DP:")
-        print("    • Considera trajetórias completas (look-ahead)")
-        print("    • Otimiza valor esperado TOTAL")
-        print("    • Captura sinergias entre skills")
-
-        print("\n  ⚡ VANTAGENS DO GULOSO:")
-        print("    • Muito mais rápido")
-        print("    • Simples de implementar")
-        print("    • Bom para decisões imediatas")
-
-        return {'greedy': greedy_result, 'dp': dp_result}
-
-    def print_market_scenarios(self):
-        """Imprime cenários de mercado."""
-        print("\n🌐 CENÁRIOS DE MERCADO:")
-
-        for name, data in self.market_scenarios['scenarios'].items():
-            print(f"\n  {name} (P={data['prob']}):")
-            print(f"    {data['description']}")
-            print(f"    Multiplicadores:")
-            for skill_id, mult in data['value_multiplier'].items():
-                skill_name = self.skills_db[skill_id]['Nome']
-                print(f"      • {skill_id} ({skill_name}): ×{mult}")
-
-        print(f"\n  Horizonte: {self.market_scenarios['horizon_years']} anos")
-        print(f"  Desconto anual: {self.market_scenarios['discount_factor']}")
-
-
-def run_challenge5():
-    """Executa Desafio 5 completo com DP verdadeiro."""
-    print_header("5️⃣ DESAFIO 5: RECOMENDAÇÃO DE HABILIDADES (MELHORADO)")
-
-    recommender = ImprovedSkillRecommender(SKILLS_DATABASE)
-
-    # Cenários de mercado
-    recommender.print_market_scenarios()
-
-    # Perfil inicial (exemplo: habilidades básicas)
-    current_profile = {'H1', 'H2', 'H3'}
-
-    print(f"\n👤 PERFIL ATUAL: {sorted(current_profile)}")
-
-    # Comparação de abordagens
-    results = recommender.compare_approaches(current_profile)
-
-    # Teste com perfil avançado
-    print("\n" + "="*80)
-    print("TESTE COM PERFIL AVANÇADO")
-    print("="*80)
-
-    advanced_profile = {'H1', 'H2', 'H3', 'H4', 'S1'}
-    print(f"\n👤 PERFIL AVANÇADO: {sorted(advanced_profile)}")
-
-    results_adv = recommender.compare_approaches(advanced_profile)
-
-    return results
-
-
-if __name__ == "__main__":
-    np.random.seed(GLOBAL_SEED)
-    run_challenge5()
+"""
+Desafio 5 — Recomendar Próximas Habilidades
+
+Objetivo: dado um perfil atual e um horizonte de 5 anos, sugerir as próximas 2–3 habilidades
+maximizando o valor esperado, considerando transições de mercado (probabilidades
+fornecidas por você ou simuladas).
+
+Sugestão técnica: usar DP em horizonte finito ou busca com “look ahead”, ponderando
+probabilidades de cenário.
+"""
+
+import numpy as np
+from typing import Dict, List, Set, Tuple
+from collections import defaultdict
+from functools import lru_cache
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from gs_config import (SKILLS_DATABASE, MARKET_SCENARIOS,
+                       MARKET_HORIZON_YEARS, MARKET_DISCOUNT_FACTOR,
+                       print_header, GLOBAL_SEED)
+from gs_soa import IDS, ID_TO_IDX, TEMPO, PRE_REQS_MASK
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _dp_sweep(time_arr, prereq_mask, ev_base, discount_pow, masks,
+                  mask_to_id, start_id, horizon, disc):  # pragma: no cover
+        """
+        Varredura forward do DP em arrays densos (SoA, sem hashing).
+
+        values_grid[b, sid] = melhor valor do estado masks[sid] no tempo
+        b*disc; estados fora da grade de disc nunca expandem (mesma
+        semântica do loop Python), então viram células terminais com o
+        melhor valor por máscara. parent_*/via_* guardam o predecessor
+        (célula de grade empacotada b*S + sid) e a skill da transição.
+        """
+        S = masks.size
+        n = time_arr.size
+        B = horizon // disc + 1
+        NEG = -np.inf
+
+        values_grid = np.full((B, S), NEG)
+        parent_grid = np.full((B, S), -1, np.int64)
+        via_grid = np.full((B, S), -1, np.int8)
+        term_val = np.full(S, NEG)
+        term_t = np.zeros(S, np.int64)
+        term_parent = np.full(S, -1, np.int64)
+        term_via = np.full(S, -1, np.int8)
+
+        values_grid[0, start_id] = 0.0
+        processed = 0
+
+        # Poda por dominância: se a mesma máscara já foi alcançada num
+        # tempo <= t com valor >= cur, toda continuação daqui é coberta
+        # pela cópia mais cedo (desconto maior, mesmas transições), então
+        # o estado não expande
+        best_seen = np.full(S, NEG)
+
+        for b in range(B):
+            t = b * disc
+            for sid in range(S):
+                cur = values_grid[b, sid]
+                if cur == NEG:
+                    continue
+                if cur <= best_seen[sid] and not (b == 0 and sid == start_id):
+                    continue
+                best_seen[sid] = cur
+                mask = masks[sid]
+                cell = b * S + sid
+                for i in range(n):
+                    if (mask >> i) & 1:
+                        continue
+                    pm = prereq_mask[i]
+                    if (pm & mask) != pm:
+                        continue
+                    new_t = t + time_arr[i]
+                    if new_t > horizon:
+                        continue
+                    years = new_t // 2000
+                    if years > 5:
+                        years = 5
+                    x = pm & mask
+                    c = 0
+                    while x:
+                        x &= x - 1
+                        c += 1
+                    nv = cur + ev_base[i] * (1.0 + 0.05 * c) * discount_pow[years]
+                    nsid = mask_to_id[mask | (np.int64(1) << i)]
+                    if new_t % disc == 0:
+                        nb = new_t // disc
+                        if nv > values_grid[nb, nsid]:
+                            values_grid[nb, nsid] = nv
+                            parent_grid[nb, nsid] = cell
+                            via_grid[nb, nsid] = i
+                            processed += 1
+                    elif nv > term_val[nsid]:
+                        term_val[nsid] = nv
+                        term_t[nsid] = new_t
+                        term_parent[nsid] = cell
+                        term_via[nsid] = i
+                        processed += 1
+
+        return (values_grid, parent_grid, via_grid,
+                term_val, term_t, term_parent, term_via, processed)
+
+
+class ImprovedSkillRecommender:
+    """
+    ALGORITMO DP:
+
+    Estado: dp[t][frozenset(skills)] = (valor_esperado_máximo, path)
+
+    Transição:
+    Para cada tempo t:
+        Para cada conjunto de skills:
+            Para cada skill disponível h:
+                novo_tempo = t + tempo[h]
+                novo_skills = skills ∪ {h}
+                novo_valor = valor_atual + E[V(h, cenário)] × desconto^(t/2000)
+
+                Se melhor: dp[novo_tempo][novo_skills] = (novo_valor, path + [h])
+
+    Complexidade: O(T × 2^n × n) onde T = horizonte em horas, n = número de skills
+    """
+
+    def __init__(self, skills_db: Dict):
+        self.skills_db = skills_db
+        self.market_scenarios = self._define_market_scenarios()
+
+        # Estado como bitmask: com 18 skills, cada conjunto cabe num int.
+        # prereq_mask[i] tem o bit j ligado se skill_ids[j] é pré-req de i,
+        # então disponibilidade vira um AND + comparação (sem sets/hashing)
+        if skills_db is SKILLS_DATABASE:
+            # Base global: reaproveita as colunas SoA já materializadas
+            # no import de gs_soa, em vez de reconstruí-las por instância
+            self.skill_ids = list(IDS)
+            self.idx = ID_TO_IDX
+            self.n_skills = len(IDS)
+            self.prereq_mask = [int(m) for m in PRE_REQS_MASK]
+            self.time_arr = TEMPO.astype(np.int32)
+        else:
+            self.skill_ids = list(skills_db)
+            self.idx = {sid: i for i, sid in enumerate(self.skill_ids)}
+            self.n_skills = len(self.skill_ids)
+            self.prereq_mask = [
+                sum(1 << self.idx[p] for p in skills_db[s]['Pre_Reqs'])
+                for s in self.skill_ids
+            ]
+            self.time_arr = np.fromiter(
+                (skills_db[s]['Tempo'] for s in self.skill_ids),
+                dtype=np.int32, count=self.n_skills)
+
+        # Tabelas fechadas dos cenários: só sinergia e desconto dependem do
+        # estado/tempo, então Σ P(cenário)·V·mult colapsa num vetor fixo.
+        # Multiplicadores densos (cenário × skill) tiram o dict.get do
+        # cálculo: a agregação vira um produto probs @ mult
+        probs = np.array([prob for _, prob, _, _ in MARKET_SCENARIOS])
+        mult = np.ones((len(MARKET_SCENARIOS), self.n_skills))
+        for k, (_, _, mults, _) in enumerate(MARKET_SCENARIOS):
+            for sid, m in mults.items():
+                if sid in self.idx:
+                    mult[k, self.idx[sid]] = m
+        value_arr = np.fromiter(
+            (skills_db[s]['Valor'] for s in self.skill_ids),
+            dtype=np.float64, count=self.n_skills)
+        self.ev_base = (probs @ mult) * value_arr
+        self.discount_pow = np.array(
+            [MARKET_DISCOUNT_FACTOR ** y
+             for y in range(MARKET_HORIZON_YEARS + 1)])
+        self._time64 = self.time_arr.astype(np.int64)
+        self._prereq_arr = np.array(self.prereq_mask, dtype=np.int64)
+
+        # Disponibilidade só depende da máscara — memoiza por int imutável
+        # (mesmo padrão do fecho de pré-requisitos no desafio 2)
+        @lru_cache(maxsize=None)
+        def _available(mask: int) -> Tuple[int, ...]:
+            prereq_mask = self.prereq_mask
+            return tuple(i for i in range(self.n_skills)
+                         if not (mask >> i) & 1
+                         and (prereq_mask[i] & mask) == prereq_mask[i])
+        self._available_cached = _available
+
+        # Relatório dos cenários renderizado sob demanda e reutilizado nas
+        # chamadas seguintes (compare_approaches imprime mais de uma vez)
+        self._scenarios_report = None
+
+    def _mask_of(self, skills: Set[str]) -> int:
+        """Converte um conjunto de ids para bitmask."""
+        mask = 0
+        for sid in skills:
+            mask |= 1 << self.idx[sid]
+        return mask
+
+    def _reachable_states(self, start_mask: int):
+        """
+        Enumera por BFS as máscaras alcançáveis a partir do perfil.
+
+        Devolve (masks ordenadas por descoberta, vetor mask -> id denso,
+        id do estado inicial) — o universo real é uma fração minúscula
+        de 2^n, então a tabela densa do DP indexa só o que existe.
+        """
+        seen = {start_mask}
+        stack = [start_mask]
+        order = [start_mask]
+        while stack:
+            m = stack.pop()
+            for i in self._available_indices(m):
+                nm = m | (1 << i)
+                if nm not in seen:
+                    seen.add(nm)
+                    stack.append(nm)
+                    order.append(nm)
+        masks_arr = np.array(order, dtype=np.int64)
+        mask_to_id = np.full(1 << self.n_skills, -1, dtype=np.int32)
+        mask_to_id[masks_arr] = np.arange(masks_arr.size, dtype=np.int32)
+        return masks_arr, mask_to_id, 0
+
+    def _available_indices(self, mask: int) -> Tuple[int, ...]:
+        """Índices de skills disponíveis dado o bitmask adquirido."""
+        return self._available_cached(mask)
+
+    def _expected_value_masked(self, i: int, mask: int,
+                               years_ahead: int) -> float:
+        """
+        Mesma conta de _calculate_expected_value, sobre as tabelas fechadas:
+        dois produtos em vez do loop de cenários + .get por chamada.
+        """
+        synergy_bonus = 1.0 + 0.05 * (self.prereq_mask[i] & mask).bit_count()
+        return (self.ev_base[i] * synergy_bonus
+                * self.discount_pow[min(5, years_ahead)])
+
+    def _define_market_scenarios(self) -> Dict:
+        """
+        Monta a visão em dict dos cenários (impressão/compatibilidade);
+        os dados vivem em gs_config.MARKET_SCENARIOS, imutáveis no módulo.
+        """
+        return {
+            'scenarios': {
+                name: {
+                    'prob': prob,
+                    'value_multiplier': mults,
+                    'description': desc
+                }
+                for name, prob, mults, desc in MARKET_SCENARIOS
+            },
+            'horizon_years': MARKET_HORIZON_YEARS,
+            'discount_factor': MARKET_DISCOUNT_FACTOR
+        }
+
+    def _calculate_expected_value(self, skill_id: str, 
+                                  current_skills: Set[str],
+                                  years_ahead: int) -> float:
+        """
+        Calcula valor esperado de uma skill considerando cenários.
+
+        E[V] = Σ P(cenário) × V × multiplicador[cenário]
+        """
+        # Probabilidade e multiplicadores já estão colapsados em ev_base;
+        # só sinergia e desconto dependem dos argumentos (mesma conta de
+        # _expected_value_masked, que o DP usa por índice)
+        i = self.idx[skill_id]
+        mask = self._mask_of(current_skills)
+        synergy_bonus = 1.0 + 0.05 * (self.prereq_mask[i] & mask).bit_count()
+        if years_ahead <= MARKET_HORIZON_YEARS:
+            discount = self.discount_pow[years_ahead]
+        else:
+            discount = MARKET_DISCOUNT_FACTOR ** years_ahead
+        return float(self.ev_base[i] * synergy_bonus * discount)
+
+    def _get_available_skills(self, acquired: Set[str]) -> List[str]:
+        """Retorna skills cujos pré-requisitos estão satisfeitos."""
+        return [self.skill_ids[i]
+                for i in self._available_cached(self._mask_of(acquired))]
+
+    def recommend_greedy(self, current_profile: Set[str],
+                        num_recommendations: int = 3) -> Dict:
+        """
+        Abordagem GULOSA (baseline para comparação).
+
+        Seleciona skills com melhor score: E[V] / Tempo
+        """
+        profile_mask = self._mask_of(current_profile)
+        avail = np.array(self._available_cached(profile_mask), dtype=np.int64)
+
+        if avail.size == 0:
+            return {
+                'algorithm': 'Guloso (E[V]/T)',
+                'recommendations': [],
+                'all_scores': []
+            }
+
+        # Scoring vetorizado: sinergia por popcount, desconto de 1 ano e
+        # razão E[V]/T numa passada só sobre as colunas
+        synergy = 1.0 + 0.05 * np.bitwise_count(self._prereq_arr[avail]
+                                                & profile_mask)
+        evs = self.ev_base[avail] * synergy * self.discount_pow[1]
+        times = self.time_arr[avail]
+        score_vals = evs / times
+
+        # Ordena por score (estável: empates mantêm a ordem do database)
+        order = np.argsort(-score_vals, kind='stable')
+        scores = []
+        for j in order:
+            i = int(avail[j])
+            scores.append({
+                'skill_id': self.skill_ids[i],
+                'skill_name': self.skills_db[self.skill_ids[i]]['Nome'],
+                'expected_value': float(evs[j]),
+                'time': int(times[j]),
+                'score': float(score_vals[j])
+            })
+
+        return {
+            'algorithm': 'Guloso (E[V]/T)',
+            'recommendations': scores[:num_recommendations],
+            'all_scores': scores
+        }
+
+    def recommend_with_dp(self, current_profile: Set[str],
+                         max_time: int = 10000,
+                         discretization: int = 10) -> Dict:
+        """
+        Args:
+            current_profile: Skills já adquiridas
+            max_time: Horizonte de tempo (horas)
+            discretization: Passo de discretização (horas)
+
+        Returns:
+            Dict com path ótimo e recomendações
+        """
+        print(f"\n🧠 Executando DP verdadeiro (horizonte={max_time}h)...")
+
+        horizon_hours = min(max_time, self.market_scenarios['horizon_years'] * 2000)
+
+        start_mask = self._mask_of(current_profile)
+
+        if NUMBA_AVAILABLE:
+            masks_arr, mask_to_id, start_id = self._reachable_states(start_mask)
+            (values_grid, parent_grid, via_grid, term_val, term_t,
+             term_parent, term_via, processed_states) = _dp_sweep(
+                self._time64, self._prereq_arr, self.ev_base,
+                self.discount_pow, masks_arr, mask_to_id, start_id,
+                horizon_hours, discretization)
+            print(f"  Estados processados: {processed_states}")
+
+            S = masks_arr.size
+            g_best = int(np.argmax(values_grid))
+            t_best = int(np.argmax(term_val))
+            path_rev = []
+            if term_val[t_best] > values_grid.flat[g_best]:
+                best_value = float(term_val[t_best])
+                best_time = int(term_t[t_best])
+                best_mask = int(masks_arr[t_best])
+                path_rev.append(self.skill_ids[int(term_via[t_best])])
+                cell = int(term_parent[t_best])
+            else:
+                best_value = float(values_grid.flat[g_best])
+                best_time = (g_best // S) * discretization
+                best_mask = int(masks_arr[g_best % S])
+                cell = g_best
+
+            # Sobe pelos ponteiros de predecessor até o estado inicial
+            while cell != -1:
+                b, sid = divmod(cell, S)
+                if via_grid[b, sid] >= 0:
+                    path_rev.append(self.skill_ids[int(via_grid[b, sid])])
+                cell = int(parent_grid[b, sid])
+            path = path_rev[::-1]
+            best_solution = (best_mask, path)
+            return self._build_dp_result(current_profile, best_solution,
+                                         best_value, best_time)
+
+        # Fallback puro-Python: dp[tempo][bitmask] = valor_esperado.
+        # O caminho não é carregado junto do estado: cada atualização grava
+        # só um ponteiro de pai (estado anterior + skill usada) e o caminho
+        # vencedor é reconstruído uma única vez ao final — sem copiar listas
+        # crescentes a cada transição
+        dp = defaultdict(lambda: {})
+        dp[0][start_mask] = 0
+        parents: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+
+        # DP forward — o argmax global é mantido durante a própria varredura
+        # (cada escrita compara com o máximo corrente), dispensando a
+        # revarredura de todos os estados ao final
+        processed_states = 0
+        # Semente: o estado inicial (plano vazio) também era candidato na
+        # revarredura antiga
+        best_value = 0
+        best_key = (0, start_mask)
+        for t in range(0, horizon_hours + 1, discretization):
+            if t not in dp:
+                continue
+
+            # Itera dp[t] direto, sem cópia: todo Tempo é > 0, então as
+            # escritas vão sempre para dp[new_t] com new_t > t
+            for mask, current_value in dp[t].items():
+                for i in self._available_indices(mask):
+                    new_t = t + int(self.time_arr[i])
+
+                    if new_t > horizon_hours:
+                        continue
+
+                    # Calcula valor esperado com desconto temporal
+                    years_ahead = new_t / 2000
+                    expected_value = self._expected_value_masked(
+                        i, mask, int(years_ahead)
+                    )
+
+                    new_value = current_value + expected_value
+                    new_mask = mask | (1 << i)
+
+                    # Atualiza se melhor
+                    if (new_mask not in dp[new_t] or
+                        new_value > dp[new_t][new_mask]):
+                        dp[new_t][new_mask] = new_value
+                        parents[(new_t, new_mask)] = (t, mask, i)
+                        processed_states += 1
+                        if new_value > best_value:
+                            best_value = new_value
+                            best_key = (new_t, new_mask)
+
+        print(f"  Estados processados: {processed_states}")
+
+        best_solution = None
+        best_time = 0
+        if best_key is not None:
+            best_time, best_mask = best_key
+            path_rev = []
+            key = best_key
+            while key in parents:
+                prev_t, prev_mask, i = parents[key]
+                path_rev.append(self.skill_ids[i])
+                key = (prev_t, prev_mask)
+            best_solution = (best_mask, path_rev[::-1])
+
+        return self._build_dp_result(current_profile, best_solution,
+                                     best_value, best_time)
+
+    def _build_dp_result(self, current_profile: Set[str], best_solution,
+                         best_value: float, best_time: int) -> Dict:
+        """Monta o dict de retorno do DP a partir da melhor solução."""
+        if best_solution:
+            _, path = best_solution
+            # Recomenda apenas os próximos 2-3
+            next_skills = [s for s in path if s not in current_profile][:3]
+
+            recommendations = []
+            for skill_id in next_skills:
+                recommendations.append({
+                    'skill_id': skill_id,
+                    'skill_name': self.skills_db[skill_id]['Nome'],
+                    'expected_value': self._calculate_expected_value(
+                        skill_id, current_profile, 1
+                    ),
+                    'time': self.skills_db[skill_id]['Tempo']
+                })
+
+            return {
+                'algorithm': 'DP Verdadeiro',
+                'recommendations': recommendations,
+                'optimal_path': path,
+                'optimal_value': best_value,
+                'optimal_time': best_time,
+                'num_new_skills': len([s for s in path if s not in current_profile])
+            }
+
+        return {
+            'algorithm': 'DP Verdadeiro',
+            'recommendations': [],
+            'message': 'Nenhuma solução encontrada'
+        }
+
+    def compare_approaches(self, current_profile: Set[str]):
+        """
+        Comparação entre Guloso e DP.
+        """
+        print("\n" + "="*80)
+        print("COMPARAÇÃO: GULOSO vs DP VERDADEIRO")
+        print("="*80)
+
+        # Guloso
+        print("\n🏃 Executando abordagem GULOSA...")
+        greedy_result = self.recommend_greedy(current_profile, 3)
+
+        # DP
+        dp_result = self.recommend_with_dp(current_profile, max_time=5000)
+
+        # Resultados
+        print("\n📊 RESULTADOS:")
+
+        print("\n  GULOSO (Score E[V]/T):")
+        for i, rec in enumerate(greedy_result['recommendations'], 1):
+            print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
+            print(f"       E[V]={rec['expected_value']:.2f}, "
+                  f"T={rec['time']}h, Score={rec['score']:.4f}")
+
+        print("\n  DP VERDADEIRO (Valor Esperado Ótimo):")
+        if dp_result['recommendations']:
+            for i, rec in enumerate(dp_result['recommendations'], 1):
+                print(f"    {i}. {rec['skill_id']} ({rec['skill_name']})")
+                print(f"       E[V]={rec['expected_value']:.2f}, T={rec['time']}h")
+
+            print(f"\n  Path Ótimo Completo: {' → '.join(dp_result['optimal_path'])}")
+            print(f"  Valor Total Ótimo: {dp_result['optimal_value']:.2f}")
+            print(f"  Tempo Total: {dp_result['optimal_time']}h")
+        else:
+            print("    Nenhuma recomendação")
+
+        # Análise
+        print("\n💡 ANÁLISE:")
+
+        greedy_ids = set(r['skill_id'] for r in greedy_result['recommendations'])
+        dp_ids = set(r['skill_id'] for r in dp_result['recommendations'])
+
+        if greedy_ids == dp_ids:
+            print("  ✅ Guloso coincide com DP (neste caso)")
+        else:
+            overlap = greedy_ids & dp_ids
+            print(f"  ⚠️ Abordagens diferem!")
+            print(f"    Sobreposição: {overlap}")
+            print(f"    Apenas Guloso: {greedy_ids - dp_ids}")
+            print(f"    Apenas DP: {dp_ids - greedy_ids}")
+
+        print("\n  📈 VANTAGENS DO DP:")
+        print("    • Considera trajetórias completas (look-ahead)")
+        print("    • Otimiza valor esperado TOTAL")
+        print("    • Captura sinergias entre skills")
+
+        print("\n  ⚡ VANTAGENS DO GULOSO:")
+        print("    • Muito mais rápido")
+        print("    • Simples de implementar")
+        print("    • Bom para decisões imediatas")
+
+        return {'greedy': greedy_result, 'dp': dp_result}
+
+    def print_market_scenarios(self):
+        """Imprime cenários de mercado (relatório renderizado uma vez)."""
+        if self._scenarios_report is None:
+            lines = ["\n🌐 CENÁRIOS DE MERCADO:"]
+            for name, data in self.market_scenarios['scenarios'].items():
+                lines.append(f"\n  {name} (P={data['prob']}):")
+                lines.append(f"    {data['description']}")
+                lines.append(f"    Multiplicadores:")
+                for skill_id, mult in data['value_multiplier'].items():
+                    skill_name = self.skills_db[skill_id]['Nome']
+                    lines.append(f"      • {skill_id} ({skill_name}): ×{mult}")
+            lines.append(
+                f"\n  Horizonte: {self.market_scenarios['horizon_years']} anos")
+            lines.append(
+                f"  Desconto anual: {self.market_scenarios['discount_factor']}")
+            self._scenarios_report = "\n".join(lines)
+        print(self._scenarios_report)
+
+
+def run_challenge5():
+    """Executa Desafio 5 completo com DP verdadeiro."""
+    print_header("5️⃣ DESAFIO 5: RECOMENDAÇÃO DE HABILIDADES (MELHORADO)")
+
+    recommender = ImprovedSkillRecommender(SKILLS_DATABASE)
+
+    # Cenários de mercado
+    recommender.print_market_scenarios()
+
+    # Perfil inicial (exemplo: habilidades básicas)
+    current_profile = {'H1', 'H2', 'H3'}
+
+    print(f"\n👤 PERFIL ATUAL: {sorted(current_profile)}")
+
+    # Comparação de abordagens
+    results = recommender.compare_approaches(current_profile)
+
+    # Teste com perfil avançado
+    print("\n" + "="*80)
+    print("TESTE COM PERFIL AVANÇADO")
+    print("="*80)
+
+    advanced_profile = {'H1', 'H2', 'H3', 'H4', 'S1'}
+    print(f"\n👤 PERFIL AVANÇADO: {sorted(advanced_profile)}")
+
+    results_adv = recommender.compare_approaches(advanced_profile)
+
+    return results
+
+
+if __name__ == "__main__":
+    np.random.seed(GLOBAL_SEED)
+    run_challenge5()
@@ -0,0 +1,92 @@
+"""
+ESTATÍSTICAS RÁPIDAS PARA GRANDES AMOSTRAS - Global Solution MOH
+
+Resumo estatístico em passada única para os painéis de Monte Carlo:
+np.quantile ordena a amostra inteira (O(n log n)); aqui média/desvio
+saem de uma acumulação de Welford e os quantis de um histograma limitado
+(65536 bins) + CDF, tudo O(n) e compilado com Numba quando disponível.
+Os quantis são aproximados com erro máximo de meio bin — irrelevante
+para os gráficos, que é o único consumidor.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bins do histograma de quantis: 2^16 limita o erro a span/65536
+N_BINS = 65536
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fast_stats_jit(sims, qs, n_bins):
+        """
+        Média (Welford), desvio populacional, extremos e quantis
+        aproximados em duas passadas O(n) sobre o array.
+        """
+        n = sims.size
+        mean = 0.0
+        m2 = 0.0
+        minv = sims[0]
+        maxv = sims[0]
+        for i in range(n):
+            x = sims[i]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            if x < minv:
+                minv = x
+            if x > maxv:
+                maxv = x
+        std = np.sqrt(m2 / n)
+
+        quantiles = np.empty(qs.size, dtype=np.float64)
+        span = maxv - minv
+        if span == 0.0:
+            quantiles[:] = minv
+            return mean, std, minv, maxv, quantiles
+
+        scale = n_bins / span
+        hist = np.zeros(n_bins, dtype=np.int64)
+        for i in range(n):
+            b = int((sims[i] - minv) * scale)
+            if b >= n_bins:
+                b = n_bins - 1
+            hist[b] += 1
+
+        # CDF crescente: cada quantil é o centro do primeiro bin cuja
+        # contagem acumulada alcança a fração pedida
+        targets = qs * n
+        cum = 0
+        j = 0
+        for b in range(n_bins):
+            cum += hist[b]
+            while j < qs.size and cum >= targets[j]:
+                quantiles[j] = minv + (b + 0.5) / scale
+                j += 1
+            if j >= qs.size:
+                break
+        return mean, std, minv, maxv, quantiles
+
+
+def fast_stats(sims: np.ndarray, qs: np.ndarray):
+    """
+    Resumo (média, desvio, mín, máx, quantis) de uma amostra grande.
+
+    Usa o kernel Numba quando disponível; caso contrário cai no caminho
+    NumPy exato (que ordena, mas mantém a API utilizável sem o JIT).
+    """
+    sims = np.ascontiguousarray(sims, dtype=np.float64)
+    qs = np.asarray(qs, dtype=np.float64)
+    if NUMBA_AVAILABLE and sims.size > 0:
+        return _fast_stats_jit(sims, qs, N_BINS)
+    quantiles = np.quantile(sims, qs)
+    return (float(sims.mean()), float(sims.std()),
+            float(sims.min()), float(sims.max()), quantiles)
+
+
+__all__ = ['fast_stats', 'NUMBA_AVAILABLE', 'N_BINS']
@@ -1,130 +1,122 @@
-"""
-CORREÇÃO RÁPIDA - gs_visualization.py
-Execute este script para corrigir o erro do KeyError 'success'
-"""
-
-import os
-
-def fix_gs_visualization():
-    """Corrige o erro no gs_visualization.py"""
-    
-    filename = 'gs_visualization.py'
-    
-    if not os.path.exists(filename):
-        print(f"❌ Arquivo {filename} não encontrado!")
-        print("💡 Certifique-se de estar no diretório correto")
-        return False
-    
-    print(f"🔧 Corrigindo {filename}...")
-    
-    # Lê o arquivo
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Aplica correção
-    content_fixed = content.replace(
-        "label='Tempo de Aquisição', color=colors['success'],",
-        "label='Tempo de Aquisição', color=colors['acquire'],"
-    )
-    
-    # Verifica se houve alteração
-    if content == content_fixed:
-        print("ℹ️ Nenhuma correção necessária (já está correto)")
-        return True
-    
-    # Faz backup
-    backup_file = filename + '.backup'
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"💾 Backup criado: {backup_file}")
-    
-    # Salva arquivo corrigido
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content_fixed)
-    
-    print(f"✅ Arquivo {filename} corrigido com sucesso!")
-    print(f"🎯 Erro do KeyError 'success' resolvido")
-    
-    return True
-
-
-def add_colors_if_missing():
-    """Adiciona o dicionário COLORS se estiver faltando"""
-    
-    filename = 'gs_visualization.py'
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Verifica se COLORS já existe
-    if "COLORS = {" in content:
-        print("✅ Dicionário COLORS já existe")
-        return True
-    
-    print("🔧 Adicionando dicionário COLORS...")
-    
-    colors_dict = """
-# Paleta de cores para gráficos
-COLORS = {
-    'primary': '#2E86AB',      # Azul
-    'secondary': '#A23B72',    # Rosa
-    'success': '#06A77D',      # Verde
-    'warning': '#F18F01',      # Laranja
-    'danger': '#C73E1D',       # Vermelho
-    'info': '#6A4C93',         # Roxo
-    'neutral': '#6C757D'       # Cinza
-}
-"""
-    
-    # Procura onde inserir (após imports)
-    lines = content.split('\n')
-    insert_pos = 0
-    
-    for i, line in enumerate(lines):
-        if line.startswith('class ') or line.startswith('def '):
-            insert_pos = i
-            break
-    
-    # Insere COLORS
-    lines.insert(insert_pos, colors_dict)
-    content_fixed = '\n'.join(lines)
-    
-    # Salva
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content_fixed)
-    
-    print("✅ Dicionário COLORS adicionado!")
-    
-    return True
-
-
-def main():
-    """Executa todas as correções"""
-    
-    print("=" * 80)
-    print("🔧 CORREÇÃO RÁPIDA - gs_visualization.py")
-    print("=" * 80)
-    
-    # Correção 1: KeyError 'success'
-    if fix_gs_visualization():
-        print("\n✅ Correção 1 aplicada: KeyError resolvido")
-    else:
-        print("\n❌ Erro ao aplicar correção 1")
-        return
-    
-    # Correção 2: Adiciona COLORS se necessário
-    try:
-        add_colors_if_missing()
-        print("✅ Correção 2 verificada: COLORS presente")
-    except Exception as e:
-        print(f"⚠️ Aviso na correção 2: {e}")
-    
-    print("\n" + "=" * 80)
-    print("✅ TODAS AS CORREÇÕES APLICADAS COM SUCESSO!")
-    print("=" * 80)
-    
-    
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+"""
+CORREÇÃO RÁPIDA - gs_visualization.py
+Execute este script para corrigir o erro do KeyError 'success'
+"""
+
+import os
+import re
+
+# Primeira definição de classe/função do arquivo — o ponto de inserção do
+# COLORS; a busca roda no motor de regex em C, sem materializar as linhas
+_DEF_RE = re.compile(r'^(?:class |def )', re.MULTILINE)
+
+FILENAME = 'gs_visualization.py'
+
+COLORS_DICT = """
+# Paleta de cores para gráficos
+COLORS = {
+    'primary': '#2E86AB',      # Azul
+    'secondary': '#A23B72',    # Rosa
+    'success': '#06A77D',      # Verde
+    'warning': '#F18F01',      # Laranja
+    'danger': '#C73E1D',       # Vermelho
+    'info': '#6A4C93',         # Roxo
+    'neutral': '#6C757D'       # Cinza
+}
+"""
+
+
+def _apply_fixes(content: str):
+    """
+    Aplica todas as correções sobre o conteúdo em memória.
+
+    Returns:
+        Tupla (conteúdo_corrigido, lista de descrições das correções)
+    """
+    fixes = []
+
+    # Correção 1: KeyError 'success'
+    content_fixed = content.replace(
+        "label='Tempo de Aquisição', color=colors['success'],",
+        "label='Tempo de Aquisição', color=colors['acquire'],"
+    )
+    if content_fixed != content:
+        fixes.append("KeyError 'success' resolvido")
+
+    # Correção 2: Adiciona COLORS se estiver faltando (antes da primeira
+    # definição de classe/função, logo após os imports)
+    if "COLORS = {" not in content_fixed:
+        m = _DEF_RE.search(content_fixed)
+        insert_at = m.start() if m else len(content_fixed)
+        content_fixed = (content_fixed[:insert_at] + COLORS_DICT + '\n'
+                         + content_fixed[insert_at:])
+        fixes.append("Dicionário COLORS adicionado")
+
+    return content_fixed, fixes
+
+
+def fix_gs_visualization():
+    """Corrige o erro no gs_visualization.py"""
+
+    if not os.path.exists(FILENAME):
+        print(f"❌ Arquivo {FILENAME} não encontrado!")
+        print("💡 Certifique-se de estar no diretório correto")
+        return False
+
+    print(f"🔧 Corrigindo {FILENAME}...")
+
+    # Uma leitura, todas as correções em memória, uma escrita: sem abrir o
+    # mesmo arquivo duas vezes para passes separados
+    with open(FILENAME, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    content_fixed, fixes = _apply_fixes(content)
+
+    # Verifica se houve alteração
+    if content == content_fixed:
+        print("ℹ️ Nenhuma correção necessária (já está correto)")
+        return True
+
+    # Faz backup
+    backup_file = FILENAME + '.backup'
+    with open(backup_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    print(f"💾 Backup criado: {backup_file}")
+
+    # Salva arquivo corrigido
+    with open(FILENAME, 'w', encoding='utf-8') as f:
+        f.write(content_fixed)
+
+    for fix in fixes:
+        print(f"✅ {fix}")
+    print(f"✅ Arquivo {FILENAME} corrigido com sucesso!")
+
+    return True
+
+
+def add_colors_if_missing():
+    """Mantido por compatibilidade: o passe único já cobre o COLORS."""
+    return fix_gs_visualization()
+
+
+def main():
+    """Executa todas as correções"""
+
+    print("=" * 80)
+    print("🔧 CORREÇÃO RÁPIDA - gs_visualization.py")
+    print("=" * 80)
+
+    # Todas as correções num único passe leitura → memória → escrita
+    if fix_gs_visualization():
+        print("\n✅ Correções aplicadas")
+    else:
+        print("\n❌ Erro ao aplicar correções")
+        return
+
+    print("\n" + "=" * 80)
+    print("✅ TODAS AS CORREÇÕES APLICADAS COM SUCESSO!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
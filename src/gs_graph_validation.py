@@ -1,232 +1,281 @@
-"""
-Módulo de validação do grafo de habilidades
-Detecta ciclos, nós órfãos e valida estrutura
-"""
-
-from typing import Dict, List, Set, Tuple
-from collections import deque
-from gs_config import SKILLS_DATABASE, print_header
-
-class GraphValidator:
-    """Classe para validação completa do grafo de habilidades"""
-    
-    def __init__(self, skills_db: Dict):
-        """
-        Inicializa o validador com o banco de dados de habilidades.
-        
-        Args:
-            skills_db: Dicionário de habilidades
-        """
-        self.skills_db = skills_db
-        self.all_skill_ids = set(skills_db.keys())
-        
-    def validate_graph(self, verbose: bool = True) -> Tuple[bool, Dict]:
-        """
-        Valida todo o grafo de habilidades.
-        
-        Args:
-            verbose: Se True, imprime mensagens detalhadas
-            
-        Returns:
-            Tuple[bool, Dict]: (é_válido, relatório_detalhado)
-        """
-        if verbose:
-            print_header("🔍 VALIDAÇÃO DO GRAFO DE HABILIDADES")
-        
-        report = {
-            'valid': True,
-            'cycles': [],
-            'orphan_nodes': [],
-            'missing_prereqs': [],
-            'topological_order': []
-        }
-        
-        # 1. Verifica pré-requisitos inexistentes
-        orphans = self._check_orphan_prereqs()
-        if orphans:
-            report['valid'] = False
-            report['orphan_nodes'] = orphans
-            if verbose:
-                print("\n❌ ERRO: Pré-requisitos inexistentes detectados!")
-                for skill_id, missing in orphans:
-                    print(f"   • {skill_id} requer {missing} que não existe")
-                return False, report
-        
-        if verbose:
-            print("\n✅ Todos os pré-requisitos existem no banco de dados")
-        
-        # 2. Detecta ciclos usando DFS
-        has_cycle, cycle_path = self._detect_cycles()
-        if has_cycle:
-            report['valid'] = False
-            report['cycles'] = cycle_path
-            if verbose:
-                print(f"\n❌ ERRO: Ciclo detectado no grafo!")
-                print(f"   Caminho do ciclo: {' → '.join(cycle_path)}")
-                return False, report
-        
-        if verbose:
-            print("✅ Nenhum ciclo detectado (grafo acíclico)")
-        
-        # 3. Ordenação topológica
-        topo_order = self._topological_sort()
-        report['topological_order'] = topo_order
-        
-        if verbose:
-            print(f"\n✅ Ordenação topológica válida:")
-            print(f"   {' → '.join(topo_order)}")
-            
-            # Estatísticas do grafo
-            self._print_graph_statistics()
-        
-        return True, report
-    
-    def _check_orphan_prereqs(self) -> List[Tuple[str, str]]:
-        """
-        Verifica se há pré-requisitos que não existem no banco de dados.
-        
-        Returns:
-            Lista de tuplas (skill_id, prereq_missing)
-        """
-        orphans = []
-        
-        for skill_id, skill_data in self.skills_db.items():
-            prereqs = skill_data.get('Pre_Reqs', [])
-            for prereq in prereqs:
-                if prereq not in self.all_skill_ids:
-                    orphans.append((skill_id, prereq))
-        
-        return orphans
-    
-    def _detect_cycles(self) -> Tuple[bool, List[str]]:
-        """
-        Detecta ciclos no grafo usando DFS.
-        
-        Returns:
-            Tuple[bool, List[str]]: (tem_ciclo, caminho_do_ciclo)
-        """
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color = {skill: WHITE for skill in self.all_skill_ids}
-        parent = {skill: None for skill in self.all_skill_ids}
-        
-        def dfs_visit(node: str) -> Tuple[bool, List[str]]:
-            color[node] = GRAY
-            
-            prereqs = self.skills_db[node].get('Pre_Reqs', [])
-            for prereq in prereqs:
-                if color[prereq] == GRAY:
-                    # Ciclo detectado! Reconstrói o caminho
-                    cycle = [prereq, node]
-                    current = node
-                    while parent[current] and parent[current] != prereq:
-                        current = parent[current]
-                        cycle.insert(1, current)
-                    cycle.append(prereq)  # Fecha o ciclo
-                    return True, cycle
-                
-                if color[prereq] == WHITE:
-                    parent[prereq] = node
-                    has_cycle, path = dfs_visit(prereq)
-                    if has_cycle:
-                        return True, path
-            
-            color[node] = BLACK
-            return False, []
-        
-        # Executa DFS em todos os nós não visitados
-        for skill in self.all_skill_ids:
-            if color[skill] == WHITE:
-                has_cycle, cycle_path = dfs_visit(skill)
-                if has_cycle:
-                    return True, cycle_path
-        
-        return False, []
-    
-    def _topological_sort(self) -> List[str]:
-        """
-        Realiza ordenação topológica usando algoritmo de Kahn (BFS).
-        
-        Returns:
-            Lista com ordem topológica das habilidades
-        """
-        # Calcula grau de entrada (in-degree) para cada nó
-        in_degree = {skill: 0 for skill in self.all_skill_ids}
-        
-        for skill_id, skill_data in self.skills_db.items():
-            prereqs = skill_data.get('Pre_Reqs', [])
-            for prereq in prereqs:
-                in_degree[skill_id] += 1
-        
-        # Fila com nós de grau 0
-        queue = deque([skill for skill, degree in in_degree.items() if degree == 0])
-        topo_order = []
-        
-        while queue:
-            current = queue.popleft()
-            topo_order.append(current)
-            
-            # Para cada habilidade que depende da atual
-            for skill_id, skill_data in self.skills_db.items():
-                if current in skill_data.get('Pre_Reqs', []):
-                    in_degree[skill_id] -= 1
-                    if in_degree[skill_id] == 0:
-                        queue.append(skill_id)
-        
-        return topo_order
-    
-    def _print_graph_statistics(self):
-        """Imprime estatísticas do grafo"""
-        print("\n📊 ESTATÍSTICAS DO GRAFO:")
-        
-        n_nodes = len(self.all_skill_ids)
-        n_edges = sum(len(skill['Pre_Reqs']) for skill in self.skills_db.values())
-        
-        # Calcula graus
-        in_degree = {}
-        out_degree = {skill: 0 for skill in self.all_skill_ids}
-        
-        for skill_id in self.all_skill_ids:
-            prereqs = self.skills_db[skill_id].get('Pre_Reqs', [])
-            in_degree[skill_id] = len(prereqs)
-            for prereq in prereqs:
-                out_degree[prereq] += 1
-        
-        # Nós fonte (sem pré-requisitos) e sorvedouros (ninguém depende)
-        sources = [s for s, d in in_degree.items() if d == 0]
-        sinks = [s for s, d in out_degree.items() if d == 0]
-        
-        print(f"   • Nós (habilidades): {n_nodes}")
-        print(f"   • Arestas (dependências): {n_edges}")
-        print(f"   • Nós fonte (básicos): {len(sources)} - {sources}")
-        print(f"   • Nós sorvedouro (terminais): {len(sinks)} - {sinks}")
-        print(f"   • Grau médio de entrada: {n_edges/n_nodes:.2f}")
-        print(f"   • Densidade: {n_edges/(n_nodes*(n_nodes-1)):.3f}")
-
-def validate_before_optimization(skills_db: Dict = None) -> bool:
-    """
-    Função auxiliar para validar o grafo antes de otimizar.
-    
-    Args:
-        skills_db: Banco de dados de habilidades (usa padrão se None)
-        
-    Returns:
-        bool: True se válido, False caso contrário (e levanta exceção)
-    """
-    if skills_db is None:
-        skills_db = SKILLS_DATABASE
-    
-    validator = GraphValidator(skills_db)
-    is_valid, report = validator.validate_graph(verbose=True)
-    
-    if not is_valid:
-        error_msg = "\n🚫 VALIDAÇÃO FALHOU - Não é possível prosseguir!\n"
-        
-        if report['orphan_nodes']:
-            error_msg += "   Pré-requisitos inexistentes detectados.\n"
-        
-        if report['cycles']:
-            error_msg += "   Ciclos detectados no grafo.\n"
-        
-        raise ValueError(error_msg)
-    
+"""
+Módulo de validação do grafo de habilidades
+Detecta ciclos, nós órfãos e valida estrutura
+"""
+
+import sys
+import heapq
+from typing import Dict, List, Set, Tuple
+from gs_config import SKILLS_DATABASE, print_header
+from gs_input_file import SKILL_IDS
+
+class GraphValidator:
+    """Classe para validação completa do grafo de habilidades"""
+    
+    def __init__(self, skills_db: Dict, meta: Dict = None):
+        """
+        Inicializa o validador com o banco de dados de habilidades.
+        
+        Args:
+            skills_db: Dicionário de habilidades
+            meta: Adjacências pré-computadas por validate_database(...,
+                  return_meta=True); quando presentes, a passada de
+                  construção dos pré-requisitos é reaproveitada
+        """
+        self.skills_db = skills_db
+        # Para o banco padrão reusa o frozenset do módulo em vez de
+        # re-hashear todas as chaves a cada construção do validador;
+        # bancos customizados também ganham frozenset (imutável, hashes
+        # reaproveitáveis nos testes de pertinência)
+        if skills_db is SKILLS_DATABASE:
+            self.all_skill_ids = SKILL_IDS
+        else:
+            self.all_skill_ids = frozenset(skills_db.keys())
+        
+        # Adjacências construídas uma única vez, sobre ids inteiros
+        # contíguos: evita revarrer o dict e repetir .get('Pre_Reqs') em
+        # cada método, dá ao Kahn a lista de dependentes direta (O(V+E) em
+        # vez de O(V·E)) e troca um hash de string por um load indexado em
+        # cada aresta; os ids em string só voltam na saída
+        if meta is not None:
+            self._prereqs = meta['prereqs']
+        else:
+            self._prereqs = {
+                sid: data.get('Pre_Reqs', []) for sid, data in skills_db.items()
+            }
+        self._name_of = list(skills_db)
+        self._id_of = {sid: i for i, sid in enumerate(self._name_of)}
+        self._n = len(self._name_of)
+        # Pré-requisitos órfãos ficam fora da adjacência; quem os reporta
+        # é _check_orphan_prereqs, sobre self._prereqs
+        self._adj = [
+            [self._id_of[p] for p in self._prereqs[sid] if p in self._id_of]
+            for sid in self._name_of
+        ]
+        self._radj = [[] for _ in range(self._n)]
+        for i, prereq_ids in enumerate(self._adj):
+            for p in prereq_ids:
+                self._radj[p].append(i)
+        self._indeg = [len(prereq_ids) for prereq_ids in self._adj]
+        
+    def validate_graph(self, verbose: bool = True) -> Tuple[bool, Dict]:
+        """
+        Valida todo o grafo de habilidades.
+        
+        Args:
+            verbose: Se True, imprime mensagens detalhadas
+            
+        Returns:
+            Tuple[bool, Dict]: (é_válido, relatório_detalhado)
+        """
+        if verbose:
+            print_header("🔍 VALIDAÇÃO DO GRAFO DE HABILIDADES")
+        
+        report = {
+            'valid': True,
+            'cycles': [],
+            'orphan_nodes': [],
+            'missing_prereqs': [],
+            'topological_order': []
+        }
+        
+        # 1. Verifica pré-requisitos inexistentes
+        orphans = self._check_orphan_prereqs()
+        if orphans:
+            report['valid'] = False
+            report['orphan_nodes'] = orphans
+            if verbose:
+                print("\n❌ ERRO: Pré-requisitos inexistentes detectados!")
+                for skill_id, missing in orphans:
+                    print(f"   • {skill_id} requer {missing} que não existe")
+                return False, report
+        
+        if verbose:
+            print("\n✅ Todos os pré-requisitos existem no banco de dados")
+        
+        # 2. Detecta ciclos usando DFS
+        has_cycle, cycle_path = self._detect_cycles()
+        if has_cycle:
+            report['valid'] = False
+            report['cycles'] = cycle_path
+            if verbose:
+                print(f"\n❌ ERRO: Ciclo detectado no grafo!")
+                print(f"   Caminho do ciclo: {' → '.join(cycle_path)}")
+                return False, report
+        
+        if verbose:
+            print("✅ Nenhum ciclo detectado (grafo acíclico)")
+        
+        # 3. Ordenação topológica
+        topo_order = self._topological_sort()
+        report['topological_order'] = topo_order
+        
+        if verbose:
+            print(f"\n✅ Ordenação topológica válida:")
+            print(f"   {' → '.join(topo_order)}")
+            
+            # Estatísticas do grafo
+            self._print_graph_statistics()
+        
+        return True, report
+    
+    def _check_orphan_prereqs(self) -> List[Tuple[str, str]]:
+        """
+        Verifica se há pré-requisitos que não existem no banco de dados.
+        
+        Returns:
+            Lista de tuplas (skill_id, prereq_missing)
+        """
+        orphans = []
+        
+        for skill_id, prereqs in self._prereqs.items():
+            for prereq in prereqs:
+                if prereq not in self.all_skill_ids:
+                    orphans.append((skill_id, prereq))
+        
+        return orphans
+    
+    def _detect_cycles(self) -> Tuple[bool, List[str]]:
+        """
+        Detecta ciclos no grafo usando DFS.
+        
+        Returns:
+            Tuple[bool, List[str]]: (tem_ciclo, caminho_do_ciclo)
+        """
+        WHITE, GRAY, BLACK = 0, 1, 2
+        # Estado de cor em bytearray contíguo (zeros implícitos = WHITE):
+        # um load indexado por acesso, sem hash de string
+        color = bytearray(self._n)
+        adj = self._adj
+        
+        # DFS iterativo: pilha explícita de (nó, iterador de pré-requisitos)
+        # no lugar de recursão — sem frames Python por aresta e sem limite
+        # de profundidade; a própria pilha é o caminho corrente, então o
+        # ciclo é reconstruído fatiando-a (dispensa o dict de pais)
+        for root in range(self._n):
+            if color[root] != WHITE:
+                continue
+            
+            color[root] = GRAY
+            stack = [(root, iter(adj[root]))]
+            path = [root]
+            
+            while stack:
+                node, prereq_iter = stack[-1]
+                prereq = next(prereq_iter, None)
+                
+                if prereq is None:
+                    color[node] = BLACK
+                    stack.pop()
+                    path.pop()
+                elif color[prereq] == GRAY:
+                    # Ciclo detectado! O trecho da pilha a partir de prereq
+                    # é exatamente o caminho do ciclo
+                    cycle = path[path.index(prereq):]
+                    cycle.append(prereq)  # Fecha o ciclo
+                    return True, [self._name_of[i] for i in cycle]
+                elif color[prereq] == WHITE:
+                    color[prereq] = GRAY
+                    stack.append((prereq, iter(adj[prereq])))
+                    path.append(prereq)
+        
+        return False, []
+    
+    def _topological_sort(self) -> List[str]:
+        """
+        Realiza ordenação topológica usando algoritmo de Kahn (BFS).
+        
+        Returns:
+            Lista com ordem topológica das habilidades
+        """
+        # Grau de entrada pré-computado no __init__ (cópia: o Kahn muta);
+        # toda a varredura trabalha sobre ids inteiros
+        in_degree = self._indeg[:]
+        radj = self._radj
+        
+        # Min-heap de ids no lugar da deque: entre os nós de grau 0 sai
+        # sempre o de menor id, então a ordem topológica é canônica e
+        # reprodutível, independente da ordem de inserção na fila
+        heap = [i for i in range(self._n) if in_degree[i] == 0]
+        heapq.heapify(heap)
+        topo_ids = []
+        
+        while heap:
+            current = heapq.heappop(heap)
+            topo_ids.append(current)
+            
+            # Dependentes diretos vêm da adjacência reversa pré-construída
+            for dep in radj[current]:
+                in_degree[dep] -= 1
+                if in_degree[dep] == 0:
+                    heapq.heappush(heap, dep)
+        
+        return [self._name_of[i] for i in topo_ids]
+    
+    def _print_graph_statistics(self):
+        """Imprime estatísticas do grafo"""
+        n_nodes = self._n
+        n_edges = sum(self._indeg)
+        
+        # Nós fonte (sem pré-requisitos) e sorvedouros (ninguém depende),
+        # direto das adjacências pré-construídas
+        sources = [self._name_of[i] for i, d in enumerate(self._indeg) if d == 0]
+        sinks = [self._name_of[i] for i, deps in enumerate(self._radj) if not deps]
+        
+        # Relatório montado em memória e emitido numa única escrita, em vez
+        # de um print (e potencialmente um syscall) por linha
+        lines = [
+            "\n📊 ESTATÍSTICAS DO GRAFO:",
+            f"   • Nós (habilidades): {n_nodes}",
+            f"   • Arestas (dependências): {n_edges}",
+            f"   • Nós fonte (básicos): {len(sources)} - {sources}",
+            f"   • Nós sorvedouro (terminais): {len(sinks)} - {sinks}",
+            f"   • Grau médio de entrada: {n_edges/n_nodes:.2f}",
+            f"   • Densidade: {n_edges/(n_nodes*(n_nodes-1)):.3f}",
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+# Resultado de validação por banco: SKILLS_DATABASE é constante de módulo,
+# então revalidar o mesmo objeto a cada chamada só repete trabalho O(V+E).
+# Chave (id, len) — o len é um guarda barato contra reuso de id
+_VALIDATION_CACHE: Dict[Tuple[int, int], bool] = {}
+
+
+def clear_validation_cache() -> None:
+    """Esvazia o cache de validação (após mutar um banco já validado)."""
+    _VALIDATION_CACHE.clear()
+
+
+def validate_before_optimization(skills_db: Dict = None) -> bool:
+    """
+    Função auxiliar para validar o grafo antes de otimizar.
+    
+    Args:
+        skills_db: Banco de dados de habilidades (usa padrão se None)
+        
+    Returns:
+        bool: True se válido, False caso contrário (e levanta exceção)
+    """
+    if skills_db is None:
+        skills_db = SKILLS_DATABASE
+    
+    cache_key = (id(skills_db), len(skills_db))
+    if cache_key in _VALIDATION_CACHE:
+        return _VALIDATION_CACHE[cache_key]
+    
+    validator = GraphValidator(skills_db)
+    is_valid, report = validator.validate_graph(verbose=True)
+    
+    if not is_valid:
+        error_msg = "\n🚫 VALIDAÇÃO FALHOU - Não é possível prosseguir!\n"
+        
+        if report['orphan_nodes']:
+            error_msg += "   Pré-requisitos inexistentes detectados.\n"
+        
+        if report['cycles']:
+            error_msg += "   Ciclos detectados no grafo.\n"
+        
+        raise ValueError(error_msg)
+    
+    _VALIDATION_CACHE[cache_key] = True
     return True
\ No newline at end of file
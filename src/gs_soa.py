@@ -0,0 +1,47 @@
+"""
+ESPELHO SoA DO SKILLS_DATABASE - Global Solution MOH
+
+Colunas numéricas contíguas (Structure of Arrays) construídas uma única vez
+no import. Os loops quentes indexam memória contígua por índice inteiro em
+vez de perseguir dois ponteiros (dict de dicts) a cada acesso; os ids em
+string ficam apenas para exibição.
+"""
+
+import numpy as np
+
+from gs_config import SKILLS_DATABASE
+
+# Ordem canônica = ordem de inserção de SKILLS_DATABASE
+IDS = tuple(SKILLS_DATABASE)
+ID_TO_IDX = {s: i for i, s in enumerate(IDS)}
+
+_N = len(IDS)
+# int16: metade da banda de cache por elemento e o dobro de lanes SIMD nos
+# matmuls/cumsums — os guards abaixo garantem que nenhuma soma estoura
+VALOR = np.fromiter((d['Valor'] for d in SKILLS_DATABASE.values()),
+                    dtype=np.int16, count=_N)
+TEMPO = np.fromiter((d['Tempo'] for d in SKILLS_DATABASE.values()),
+                    dtype=np.int16, count=_N)
+COMPLEXIDADE = np.fromiter((d['Complexidade'] for d in SKILLS_DATABASE.values()),
+                           dtype=np.int16, count=_N)
+
+assert int(VALOR.astype(np.int64).sum()) < np.iinfo(np.int16).max
+assert int(TEMPO.astype(np.int64).sum()) < np.iinfo(np.int16).max
+
+# Bitmask de pré-requisitos diretos: bit j ligado em PRE_REQS_MASK[i]
+# significa que IDS[j] é pré-requisito de IDS[i]
+PRE_REQS_MASK = np.zeros(_N, dtype=np.int64)
+for _i, _d in enumerate(SKILLS_DATABASE.values()):
+    _m = 0
+    for _p in _d['Pre_Reqs']:
+        _m |= 1 << ID_TO_IDX[_p]
+    PRE_REQS_MASK[_i] = _m
+
+__all__ = [
+    'IDS',
+    'ID_TO_IDX',
+    'VALOR',
+    'TEMPO',
+    'COMPLEXIDADE',
+    'PRE_REQS_MASK'
+]